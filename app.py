@@ -1,15 +1,43 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, session
+from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, session, g, Response, stream_with_context
 from datetime import datetime, timedelta
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+import csv
+import io
 import smtplib
 from email.mime.text import MIMEText
 import os
 import json
+import logging
+import hashlib
+import re
+import threading
+import time
+import traceback
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
 from typing import Dict, List, Optional
 from dotenv import load_dotenv
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
+from sqlalchemy import case, delete, event, exists, func, insert, inspect, literal, null, select, union_all
+from sqlalchemy.orm import Session as SASession, selectinload
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson parses and writes stored JSON (custom payment schedules) several times faster when installed
+_json_loads = orjson.loads if orjson else json.loads
+
+def _json_dumps(obj):
+    """Serialize obj to a JSON str, via orjson when available."""
+    return orjson.dumps(obj).decode() if orjson else json.dumps(obj)
 
 # Database imports
-from models import db, User, Role, Member, Transaction, Semester, Payment, BudgetLimit, TreasurerConfig, Event, init_default_roles
+from models import db, User, Role, Member, Transaction, Semester, Payment, BudgetLimit, TreasurerConfig, Event, init_default_roles, user_roles, ROLE_HIERARCHY
 from database import create_app as create_database_app, init_database
 
 # Import Flask blueprints
@@ -23,6 +51,9 @@ from portal import portal_bp
 # Load environment variables
 load_dotenv()
 
+logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO').upper())
+logger = logging.getLogger(__name__)
+
 # Initialize Flask app with database support
 database_url = os.environ.get('DATABASE_URL')
 if not database_url:
@@ -37,15 +68,27 @@ login_manager.init_app(app)
 login_manager.login_view = 'login'
 login_manager.login_message = 'Please log in to access this page.'
 
+# Celery app for background SMS delivery (None unless CELERY_BROKER_URL is set)
+celery = app.extensions.get('celery')
+
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
-
-# Initialize database tables
+    # Session.get answers from the identity map when the user is already loaded
+    user_id = int(user_id)
+    loaded_users = g.setdefault('loaded_users', {})
+    if user_id not in loaded_users:
+        loaded_users[user_id] = db.session.get(User, user_id)
+    return loaded_users[user_id]
+
+# Initialize database tables - warm starts only pay for the table-name lookup
+# (new indexes on existing tables are added by `python database.py init`)
 print("🔄 Initializing database tables...")
 with app.app_context():
     try:
-        db.create_all()
+        missing_tables = set(db.metadata.tables) - set(inspect(db.engine).get_table_names())
+        if missing_tables:
+            print(f"🔄 Creating missing tables: {', '.join(sorted(missing_tables))}")
+            db.create_all()
         print("✅ Database tables ready")
     except Exception as e:
         print(f"⚠️ Database table creation warning: {e}")
@@ -78,73 +121,189 @@ SMS_GATEWAYS = {
 
 # Primary gateways that work most reliably
 PRIMARY_GATEWAYS = ['verizon', 'att', 'tmobile']
+PRIMARY_GATEWAY_ADDRESSES = tuple((name, SMS_GATEWAYS[name]) for name in PRIMARY_GATEWAYS)
+
+# Deletes every Latin-1 character except 0-9 in one C-level pass
+_KEEP_DIGITS = str.maketrans('', '', ''.join(chr(i) for i in range(256) if chr(i) not in '0123456789'))
+_NON_DIGIT = re.compile(r'[^0-9]')
+
+def _digits_only(text):
+    """Return just the ASCII digits in ``text``"""
+    digits = text.translate(_KEEP_DIGITS)
+    if not digits.isascii():
+        digits = _NON_DIGIT.sub('', digits)  # Rare: characters outside the table survived
+    return digits
+
+@lru_cache(maxsize=2048)
+def _normalize_phone(phone):
+    """Return the 10-digit US number for ``phone``, or None if it isn't one"""
+    digits = _digits_only(phone)
+    if len(digits) == 11 and digits.startswith('1'):
+        return digits[1:]  # Remove leading 1
+    return digits if len(digits) == 10 else None
+
+# Credentials that were just rejected fail fast instead of re-running STARTTLS+AUTH
+_AUTH_FAILURE_TTL = 300  # seconds
+_auth_failures = {}  # credentials hash -> time.monotonic() expiry
+
+def _credentials_key(smtp_username, smtp_password):
+    return hashlib.blake2b(f'{smtp_username}\0{smtp_password}'.encode(), digest_size=8).hexdigest()
+
+def _smtp_auth_recently_failed(smtp_username, smtp_password):
+    expires_at = _auth_failures.get(_credentials_key(smtp_username, smtp_password))
+    return expires_at is not None and time.monotonic() < expires_at
+
+SMTP_HOST = 'smtp.gmail.com'
+SMTP_PORT = 587
+
+class SMTPPool:
+    """Keep authenticated SMTP connections open between sends.
+    
+    A connection is checked out for the duration of a ``with`` block so only one
+    thread uses it at a time, then parked for reuse. Parked connections idle for
+    longer than ``max_idle`` seconds, or that fail a NOOP, are replaced.
+    """
+    
+    def __init__(self, host=SMTP_HOST, port=SMTP_PORT, timeout=30, max_idle=60):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self._idle = {}  # (host, port, username) -> (smtp, last_used_ts)
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def get(self, username, password):
+        key = (self.host, self.port, username)
+        with self._lock:
+            server, last_used = self._idle.pop(key, (None, 0))
+        
+        if server is not None and not self._is_alive(server, last_used):
+            self._close(server)
+            server = None
+        
+        if server is None:
+            server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            try:
+                server.starttls()
+                server.login(username, password)
+            except Exception:
+                self._close(server)
+                raise
+        
+        try:
+            yield server
+        except Exception:
+            # Connection state is unknown after a failed send - don't reuse it
+            self._close(server)
+            raise
+        
+        with self._lock:
+            stale, _ = self._idle.pop(key, (None, 0))
+            self._idle[key] = (server, time.time())
+        if stale is not None:
+            self._close(stale)
+    
+    def _is_alive(self, server, last_used):
+        if time.time() - last_used >= self.max_idle:
+            return False
+        try:
+            return server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+    
+    @staticmethod
+    def _close(server):
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+smtp_pool = SMTPPool()
 
 def send_email_to_sms(phone, message, config):
     """Send SMS via email-to-SMS gateway with improved error handling"""
     if not config.smtp_username or not config.smtp_password:
-        print("SMS Error: SMTP credentials not configured")
+        logger.error("SMS Error: SMTP credentials not configured")
+        return False
+    
+    if _smtp_auth_recently_failed(config.smtp_username, config.smtp_password):
+        logger.warning("SMS Error: Skipped - SMTP authentication failed recently, check Gmail app password")
         return False
     
     # Clean and validate phone number
-    clean_phone = ''.join(filter(str.isdigit, phone))
-    if len(clean_phone) == 11 and clean_phone.startswith('1'):
-        clean_phone = clean_phone[1:]  # Remove leading 1
-    elif len(clean_phone) != 10:
-        print(f"SMS Error: Invalid phone number format: {phone}")
+    clean_phone = _normalize_phone(phone)
+    if clean_phone is None:
+        logger.warning("SMS Error: Invalid phone number format: %s", phone)
         return False
     
     # Limit message length for SMS compatibility
     if len(message) > 160:
         message = message[:157] + "..."
     
-    # Try primary gateways first (most reliable)
-    gateways_to_try = [(name, SMS_GATEWAYS[name]) for name in PRIMARY_GATEWAYS]
+    # Hand off to a Celery worker when configured so the request doesn't wait on SMTP
+    if celery is not None:
+        _send_email_to_sms_task.delay(clean_phone, message, config.smtp_username, config.smtp_password)
+        logger.debug("SMS queued for delivery to %s", clean_phone)
+        return True
+    
+    return deliver_email_to_sms(clean_phone, message, config.smtp_username, config.smtp_password)
+
+def deliver_email_to_sms(clean_phone, message, smtp_username, smtp_password):
+    """Deliver an already-validated SMS through the carrier gateways"""
+    # Build and serialize the message once; only the recipient differs between gateways
+    msg = MIMEText(message)
+    msg['Subject'] = ''  # Empty subject for SMS
+    msg['From'] = smtp_username
+    payload = msg.as_string()
     
-    success_count = 0
     last_error = None
     
-    for carrier, gateway in gateways_to_try:
+    # Try primary gateways in order and stop at the first that accepts the message;
+    # the relay accepts any gateway address, so trying more would only send duplicates
+    for carrier, gateway in PRIMARY_GATEWAY_ADDRESSES:
         try:
             sms_email = clean_phone + gateway
-            print(f"Attempting SMS via {carrier} to {sms_email}")
-        
-            # Create email message
-            msg = MIMEText(message)
-            msg['Subject'] = ''  # Empty subject for SMS
-            msg['From'] = config.smtp_username
-            msg['To'] = sms_email
-        
-            # Send via SMTP with timeout settings
-            server = smtplib.SMTP('smtp.gmail.com', 587, timeout=10)  # 10 second timeout
-            server.set_debuglevel(0)  # Disable debug for production
-            server.starttls()
-            server.login(config.smtp_username, config.smtp_password)
-            server.send_message(msg)
-            server.quit()
-        
-            success_count += 1
-            print(f"SMS sent successfully via {carrier}")
-        
-            # Don't try other gateways if one succeeds
-            break
+            logger.debug("Attempting SMS via %s to %s", carrier, sms_email)
+            
+            # Send over a pooled, already-authenticated connection when available
+            with smtp_pool.get(smtp_username, smtp_password) as server:
+                server.sendmail(smtp_username, [sms_email], f"To: {sms_email}\n{payload}")
+            
+            logger.debug("SMS sent successfully via %s", carrier)
+            _auth_failures.pop(_credentials_key(smtp_username, smtp_password), None)
+            return True
         
         except smtplib.SMTPAuthenticationError as e:
-            print(f"SMS Error ({carrier}): Authentication failed - check Gmail app password")
+            logger.error("SMS Error (%s): Authentication failed - check Gmail app password", carrier)
             last_error = f"Authentication failed: {str(e)}"
+            _auth_failures[_credentials_key(smtp_username, smtp_password)] = time.monotonic() + _AUTH_FAILURE_TTL
             break  # No point trying other gateways if auth fails
         except smtplib.SMTPException as e:
-            print(f"SMS Error ({carrier}): SMTP error - {str(e)}")
+            logger.debug("SMS Error (%s): SMTP error - %s", carrier, e)
             last_error = f"SMTP error: {str(e)}"
             continue  # Try next gateway
         except Exception as e:
-            print(f"SMS Error ({carrier}): {str(e)}")
+            logger.debug("SMS Error (%s): %s", carrier, e)
             last_error = f"General error: {str(e)}"
             continue  # Try next gateway
     
-    if success_count == 0:
-        print(f"SMS Failed: All gateways failed. Last error: {last_error}")
-    
-    return success_count > 0
+    logger.warning("SMS Failed: All gateways failed. Last error: %s", last_error)
+    return False
+
+if celery is not None:
+    @celery.task(bind=True, max_retries=3, default_retry_delay=30, autoretry_for=(smtplib.SMTPException,))
+    def _send_email_to_sms_task(self, clean_phone, message, smtp_username, smtp_password):
+        """Celery task: deliver SMS in a worker (run with `celery -A app.celery worker --loglevel=info`)"""
+        with app.app_context():
+            if _smtp_auth_recently_failed(smtp_username, smtp_password):
+                return  # Retrying with rejected credentials won't help
+            if not deliver_email_to_sms(clean_phone, message, smtp_username, smtp_password):
+                raise smtplib.SMTPException(f"SMS delivery to {clean_phone} failed")
+
+
+# "Name: ..." / "Phone: ..." lines in a new brother registration notice
+_BROTHER_FIELDS_RE = re.compile(r'^(Name|Phone):[ \t]*(.+?)[ \t\r]*$', re.M)
 
 def notify_treasurer(message, config, notification_type="Alert"):
     """Send notification to treasurer via SMS and email"""
@@ -161,11 +320,8 @@ def notify_treasurer(message, config, notification_type="Alert"):
             msg['From'] = config.smtp_username
             msg['To'] = config.email
         
-            server = smtplib.SMTP('smtp.gmail.com', 587, timeout=10)
-            server.starttls()
-            server.login(config.smtp_username, config.smtp_password)
-            server.send_message(msg)
-            server.quit()
+            with smtp_pool.get(config.smtp_username, config.smtp_password) as server:
+                server.send_message(msg)
             sent = True
         except Exception:
             pass
@@ -175,13 +331,11 @@ def notify_treasurer(message, config, notification_type="Alert"):
         # Create SMS-friendly message based on notification type
         if notification_type == "New Brother Registration":
             # Extract key info for SMS
-            lines = message.split('\\n')
-            name_line = next((line for line in lines if line.startswith('Name:')), '')
-            phone_line = next((line for line in lines if line.startswith('Phone:')), '')
+            fields = dict(_BROTHER_FIELDS_RE.findall(message))
+            name = fields.get('Name')
+            phone = fields.get('Phone')
             
-            if name_line and phone_line:
-                name = name_line.replace('Name: ', '')
-                phone = phone_line.replace('Phone: ', '')
+            if name and phone:
                 sms_message = f"New brother: {name} ({phone}) registered. Check admin panel to verify."
             else:
                 sms_message = "New brother registration. Check admin panel."
@@ -189,7 +343,7 @@ def notify_treasurer(message, config, notification_type="Alert"):
             # For other notification types, use the existing truncation
             sms_message = f"Treasurer {notification_type}: {message[:100]}..." if len(message) > 100 else f"Treasurer {notification_type}: {message}"
         
-            print(f"📱 SMS Message ({len(sms_message)} chars): {sms_message}")
+        logger.debug("📱 SMS Message (%d chars): %s", len(sms_message), sms_message)
         if send_email_to_sms(config.phone, sms_message, config):
             sent = True
     
@@ -461,6 +615,11 @@ MEMBER_ROLE_PERMISSIONS = {
     }
 }
 
+# Freeze the per-role tables - ROLE_PERMISSION_MASKS below is derived from them at import
+MEMBER_ROLE_PERMISSIONS = {
+    role: MappingProxyType(permissions) for role, permissions in MEMBER_ROLE_PERMISSIONS.items()
+}
+
 # Legacy role permissions for backwards compatibility
 ROLE_PERMISSIONS = {
     'admin': MEMBER_ROLE_PERMISSIONS['admin'],
@@ -468,43 +627,63 @@ ROLE_PERMISSIONS = {
     'president': MEMBER_ROLE_PERMISSIONS['president']
 }
 
+# Permission tables encoded as one bit per permission name and one mask per role.
+# Legacy ROLE_PERMISSIONS roles are a subset of MEMBER_ROLE_PERMISSIONS, so they're covered here.
+PERMISSION_BITS = {
+    name: bit
+    for bit, name in enumerate(sorted({name for permissions in MEMBER_ROLE_PERMISSIONS.values() for name in permissions}))
+}
+ROLE_PERMISSION_MASKS = {
+    role: sum(1 << PERMISSION_BITS[name] for name, granted in permissions.items() if granted)
+    for role, permissions in MEMBER_ROLE_PERMISSIONS.items()
+}
+
 def get_current_user_role():
+    """Get current user's role, computed once per request and kept on flask.g"""
+    if 'current_user_role' not in g:
+        g.current_user_role = _lookup_current_user_role()
+    return g.current_user_role
+
+def _lookup_current_user_role():
     """Get current user's role based on session and database"""
     if session.get('preview_mode'):
         return session.get('preview_role', 'admin')
     
     # Check if user is admin/treasurer
-    if session.get('user') == 'admin' or session.get('role') == 'admin':
+    if 'admin' in (session.get('user'), session.get('role')):
         return 'admin'
     
-    # Get role from database
+    # Get role from database - one outer join both confirms the user exists and
+    # collects their active role names (NULL when they hold none)
     user_id = session.get('user_id')
     if user_id:
-        user = User.query.get(user_id)
-        if user:
-            primary_role = user.get_primary_role()
-            return primary_role.name if primary_role else 'brother'
+        role_names = db.session.scalars(
+            db.select(Role.name)
+            .select_from(User)
+            .outerjoin(user_roles, (user_roles.c.user_id == User.id) & user_roles.c.revoked_at.is_(None))
+            .outerjoin(Role, Role.id == user_roles.c.role_id)
+            .where(User.id == user_id)
+        ).all()
+        if role_names:
+            return max(filter(None, role_names), key=lambda name: ROLE_HIERARCHY.get(name, 0), default='brother')
     
     return session.get('role', 'brother')
 
 def has_permission(permission_name):
     """Check if current user has a specific permission"""
-    role = get_current_user_role()
+    mask = g.get('role_permission_mask')
+    if mask is None:
+        mask = ROLE_PERMISSION_MASKS.get(get_current_user_role(), 0)
+        g.role_permission_mask = mask
     
-    # Check member role permissions first
-    if role in MEMBER_ROLE_PERMISSIONS:
-        return MEMBER_ROLE_PERMISSIONS[role].get(permission_name, False)
-    
-    # Fallback to legacy role permissions
-    return ROLE_PERMISSIONS.get(role, {}).get(permission_name, False)
+    bit = PERMISSION_BITS.get(permission_name)
+    return bit is not None and bool(mask >> bit & 1)
 
 def get_user_member():
-    """Get the member object for the current user"""
+    """Get the member object for the current user, looked up once per request"""
     user_id = session.get('user_id')
     if user_id:
-        user = User.query.get(user_id)
-        if user and user.member_record:
-            return user.member_record
+        return _request_memo(('user_member', user_id), lambda: Member.query.filter_by(user_id=user_id).first())
     return None
 
 def require_permission(permission_name):
@@ -526,6 +705,25 @@ BUDGET_CATEGORIES = [
     'Philanthropy', 'Recruitment', 'Phi ED', 'Housing', 'Bank Maintenance'
 ]
 
+# Form field name for each category's budget input on budget_management
+_BUDGET_FIELD_CHARS = str.maketrans({'(': '_', ')': '_', ' ': '_', ',': None})
+BUDGET_FIELD_NAMES = {category: 'budget_' + category.translate(_BUDGET_FIELD_CHARS) for category in BUDGET_CATEGORIES}
+
+_CENT = Decimal('0.01')
+
+def parse_amount(value):
+    """Parse a submitted money amount exactly and round it to whole cents"""
+    try:
+        amount = Decimal(str(value).strip())
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount: {value!r}")
+    if not amount.is_finite():
+        raise ValueError(f"Invalid amount: {value!r}")
+    return float(amount.quantize(_CENT, rounding=ROUND_HALF_UP))
+
+# Categories a transaction can be edited into: the budget categories plus dues income
+TRANSACTION_CATEGORIES = tuple(BUDGET_CATEGORIES) + ('Dues Collection',)
+
 CHAIR_MANUAL_LINKS = {
     'social_chair': None,
     'phi_ed_chair': None,
@@ -549,43 +747,161 @@ OFFICER_ROLES = [
     'brotherhood_chair'
 ]
 
+# Chair role -> chair type used in chair budget URLs and tabs (social_chair -> social)
+CHAIR_TYPE_BY_ROLE = MappingProxyType({role: role.removesuffix('_chair') for role in CHAIR_ROLE_TO_CATEGORY})
+
+# Chair type -> budget category
+CHAIR_TYPE_TO_CATEGORY = MappingProxyType({
+    CHAIR_TYPE_BY_ROLE[role]: category for role, category in CHAIR_ROLE_TO_CATEGORY.items()
+})
+
+# Chair budget tabs, in display order
+CHAIR_BUDGET_TABS = MappingProxyType({
+    'social': 'Social Chair',
+    'phi_ed': 'Phi Ed Chair',
+    'brotherhood': 'Brotherhood Chair',
+    'recruitment': 'Recruitment Chair'
+})
+
+# Officer constants are fixed, so templates read them as Jinja globals
+app.jinja_env.globals.update(
+    chair_manual_links=CHAIR_MANUAL_LINKS,
+    chair_role_to_category=CHAIR_ROLE_TO_CATEGORY,
+    officer_roles=OFFICER_ROLES,
+)
+
+# Roles an admin can preview the dashboard as, with their display names
+PREVIEW_ROLE_NAMES = {role: role.replace('_', ' ').title() for role in (*OFFICER_ROLES, 'brother')}
+
+# Chronological order of seasons within a year
+SEMESTER_SEASON_ORDER = {'Spring': 0, 'Summer': 1, 'Fall': 2}
+
+def _request_memo(key, loader):
+    """Return loader() memoized on flask.g for the rest of the request."""
+    memo = g.setdefault('summary_memo', {})
+    if key not in memo:
+        memo[key] = loader()
+    return memo[key]
+
+# Process-wide cache for small, rarely-changing lookups: key -> (expires_at, value)
+_ttl_cache = {}
+
+def _ttl_memo(key, ttl, loader):
+    """Return loader() cached across requests for ttl seconds."""
+    now = time.monotonic()
+    entry = _ttl_cache.get(key)
+    if entry is None or entry[0] <= now:
+        entry = (now + ttl, loader())
+        _ttl_cache[key] = entry
+    return entry[1]
+
+# Cached lookups to drop once a commit touches the model they were read from.
+# A name also covers the per-argument (name, ...) tuple keys cached under it.
+_TTL_CACHE_KEYS_BY_MODEL = {
+    Semester: ('current_semester_id',),
+    BudgetLimit: ('budget_limits',),
+    TreasurerConfig: ('treasurer_config',),
+    Event: ('chapter_events',),
+    Role: ('role_ids',),
+}
+
+@event.listens_for(SASession, 'after_flush')
+def _note_stale_ttl_cache(session, flush_context):
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        stale_keys = _TTL_CACHE_KEYS_BY_MODEL.get(type(obj))
+        if stale_keys:
+            session.info.setdefault('stale_ttl_keys', set()).update(stale_keys)
+
+@event.listens_for(SASession, 'after_commit')
+def _drop_stale_ttl_cache(session):
+    stale_keys = session.info.pop('stale_ttl_keys', None)
+    if stale_keys:
+        for key in [key for key in _ttl_cache if (key[0] if isinstance(key, tuple) else key) in stale_keys]:
+            _ttl_cache.pop(key, None)
+
+@event.listens_for(SASession, 'after_rollback')
+def _forget_stale_ttl_cache(session):
+    session.info.pop('stale_ttl_keys', None)
+
+def get_current_semester_id():
+    """Id of the current semester, cached for a minute."""
+    return _ttl_memo('current_semester_id', 60,
+                     lambda: db.session.query(Semester.id).filter_by(is_current=True).limit(1).scalar())
+
+def get_budget_limit_rows():
+    """(category, amount, semester_id) rows for every budget limit, cached for 30 seconds."""
+    return _ttl_memo('budget_limits', 30,
+                     lambda: db.session.query(BudgetLimit.category, BudgetLimit.amount, BudgetLimit.semester_id).all())
+
+def get_role_ids():
+    """Role name -> id for the whole (tiny) roles table, cached for 5 minutes."""
+    return _ttl_memo('role_ids', 300, lambda: MappingProxyType(dict(db.session.query(Role.name, Role.id).all())))
+
+def get_chapter_events(semester_id):
+    """(date, title, category, location) rows for a semester's events in date order, cached for 5 minutes."""
+    return _ttl_memo(('chapter_events', semester_id), 300,
+                     lambda: db.session.query(Event.date, Event.title, Event.category, Event.location)
+                     .filter_by(semester_id=semester_id).order_by(Event.date.asc()).all())
+
+def _load_treasurer_config():
+    config = TreasurerConfig.query.first()
+    if config is None:
+        return None
+    return SimpleNamespace(**{attr.key: getattr(config, attr.key) for attr in inspect(TreasurerConfig).column_attrs})
+
+def get_treasurer_config():
+    """Read-only snapshot of the treasurer config row (or None), cached for 30 seconds."""
+    return _ttl_memo('treasurer_config', 30, _load_treasurer_config)
+
 def build_budget_summary(semester_id=None, categories=None):
     """Build budget summary data for given semester and categories."""
-    budget_summary = {}
-    budget_limits = BudgetLimit.query
+    key = ('budget', semester_id, tuple(categories) if categories else None)
+    return _request_memo(key, lambda: _build_budget_summary(semester_id, categories))
+
+def _build_budget_summary(semester_id, categories):
+    spent_query = db.session.query(
+        Transaction.semester_id, Transaction.category, func.sum(Transaction.amount).label('spent')
+    ).filter(Transaction.type == 'expense')
+    budget_limits = db.session.query(BudgetLimit.category, BudgetLimit.amount)
     if semester_id:
-        budget_limits = budget_limits.filter_by(semester_id=semester_id)
-    budget_limits = budget_limits.all()
+        budget_limits = budget_limits.filter(BudgetLimit.semester_id == semester_id)
+        spent_query = spent_query.filter(Transaction.semester_id == semester_id)
+    if categories:
+        budget_limits = budget_limits.filter(BudgetLimit.category.in_(categories))
+        spent_query = spent_query.filter(Transaction.category.in_(categories))
+    
+    # Each limit joined to its (semester, category) expense total in a single statement
+    spent = spent_query.group_by(Transaction.semester_id, Transaction.category).subquery()
+    budget_rows = (
+        budget_limits.add_columns(func.coalesce(spent.c.spent, 0))
+        .outerjoin(spent, (spent.c.semester_id == BudgetLimit.semester_id) & (spent.c.category == BudgetLimit.category))
+        .order_by(BudgetLimit.id)
+    )
     
-    for limit in budget_limits:
-        if categories and limit.category not in categories:
-            continue
-        expense_transactions = Transaction.query.filter_by(
-            type='expense',
-            category=limit.category,
-            semester_id=limit.semester_id
-        ).all()
-        spent = sum(t.amount for t in expense_transactions)
-        remaining = limit.amount - spent
-        percent_used = (spent / limit.amount * 100) if limit.amount > 0 else 0
-        budget_summary[limit.category] = {
-            'budget_limit': limit.amount,
-            'spent': spent,
-            'remaining': remaining,
-            'percent_used': percent_used
+    budget_summary = {}
+    for category, budget_limit, spent_amount in budget_rows:
+        budget_summary[category] = {
+            'budget_limit': budget_limit,
+            'spent': spent_amount,
+            'remaining': budget_limit - spent_amount,
+            'percent_used': (spent_amount / budget_limit * 100) if budget_limit > 0 else 0
         }
     
     return budget_summary
 
 def build_dues_summary(semester_id=None):
     """Build dues collection summary for a semester."""
-    members_query = Member.query
+    return _request_memo(('dues', semester_id), lambda: _build_dues_summary(semester_id))
+
+def _build_dues_summary(semester_id):
+    projected_query = db.session.query(func.sum(Member.dues_amount))
+    collected_query = db.session.query(func.sum(Payment.amount)).join(Member)
     if semester_id:
-        members_query = members_query.filter_by(semester_id=semester_id)
-    members = members_query.all()
+        projected_query = projected_query.filter(Member.semester_id == semester_id)
+        collected_query = collected_query.filter(Member.semester_id == semester_id)
     
-    total_projected = sum(member.dues_amount for member in members)
-    total_collected = sum(sum(payment.amount for payment in member.payments) for member in members)
+    total_projected = projected_query.scalar() or 0
+    total_collected = collected_query.scalar() or 0
     outstanding = total_projected - total_collected
     collection_rate = (total_collected / total_projected * 100) if total_projected > 0 else 0
     
@@ -596,6 +912,75 @@ def build_dues_summary(semester_id=None):
         'collection_rate': collection_rate
     }
 
+def build_dashboard_exec_summary(semester_id):
+    """Member count, dues summary and budget summary for a semester's exec dashboard."""
+    collected = (
+        db.select(func.coalesce(func.sum(Payment.amount), 0))
+        .join(Member, Payment.member_id == Member.id)
+        .where(Member.semester_id == semester_id)
+        .scalar_subquery()
+    )
+    total_members, total_projected, total_collected = db.session.query(
+        func.count(Member.id), func.coalesce(func.sum(Member.dues_amount), 0), collected
+    ).filter(Member.semester_id == semester_id).one()
+    
+    return {
+        'total_members': total_members,
+        'dues_summary': {
+            'total_collected': total_collected,
+            'total_projected': total_projected,
+            'outstanding': total_projected - total_collected,
+            'collection_rate': (total_collected / total_projected * 100) if total_projected > 0 else 0
+        },
+        'budget_summary': build_budget_summary(semester_id)
+    }
+
+def member_payment_totals(member_id):
+    """Return (total_paid, {calendar month: amount}) for a member from one GROUP BY."""
+    month = func.extract('month', Payment.date)
+    month_totals = {
+        int(payment_month): amount
+        for payment_month, amount in db.session.query(month, func.sum(Payment.amount))
+        .filter(Payment.member_id == member_id)
+        .group_by(month)
+    }
+    return sum(month_totals.values()), month_totals
+
+# plan: (number of payments, days between due dates, calendar months per payment, description)
+# A None month span means one payment covering the whole semester, due now.
+PAYMENT_PLAN_PERIODS = {
+    'monthly': (4, 32, 1, 'Monthly payment {n}/4'),
+    'bimonthly': (2, 60, 2, 'Bi-monthly payment {n}/2'),
+    'semester': (1, 0, None, 'Full semester payment'),
+}
+
+def build_payment_schedule(member, month_totals, total_paid, start_date=None):
+    """Build the monthly, semester or bimonthly payment schedule for a member."""
+    plan = PAYMENT_PLAN_PERIODS.get(member.payment_plan)
+    if plan is None:
+        return []
+    
+    periods, step_days, month_span, description = plan
+    period_amount = member.dues_amount / periods
+    start_date = start_date or datetime.now()
+    payment_schedule = []
+    for i in range(periods):
+        if month_span is None:
+            due_date = start_date
+            period_paid = total_paid
+        else:
+            due_date = (start_date.replace(day=1) + timedelta(days=step_days*i)).replace(day=1)
+            first_month = start_date.month - 1 + month_span*i
+            period_paid = sum(month_totals.get((first_month + k) % 12 + 1, 0) for k in range(month_span))
+        payment_schedule.append({
+            'due_date': due_date.isoformat(),
+            'amount': period_amount,
+            'description': description.format(n=i + 1),
+            'status': 'paid' if period_paid >= period_amount else 'pending',
+            'amount_due': max(0, period_amount - period_paid)
+        })
+    return payment_schedule
+
 
 
 
@@ -696,34 +1081,32 @@ def force_logout():
 def monthly_income():
     try:
         # Database mode - get data from SQLAlchemy models
-        from models import Payment
-        print("🔍 Using database mode for monthly income")
+        logger.debug("🔍 Using database mode for monthly income")
+        
+        # Group payments by month in the database; only one row per month comes back
+        year = func.extract('year', Payment.date)
+        month = func.extract('month', Payment.date)
+        monthly_rows = (
+            db.session.query(year, month, func.sum(Payment.amount), func.count(Payment.id))
+            .group_by(year, month)
+            .order_by(year, month)
+            .all()
+        )
         
-        # Get all payments grouped by month
-        payments = Payment.query.all()
         monthly_data = {}
+        for payment_year, payment_month, total_amount, transaction_count in monthly_rows:
+            month_start = datetime(int(payment_year), int(payment_month), 1)
+            monthly_data[f"{month_start.year:04d}-{month_start.month:02d}"] = {
+                'month_name': month_start.strftime('%B %Y'),
+                'total_amount': float(total_amount or 0),
+                'transaction_count': transaction_count
+            }
         
-        for payment in payments:
-            month_key = payment.date.strftime('%Y-%m')
-            month_name = payment.date.strftime('%B %Y')
-            
-            if month_key not in monthly_data:
-                monthly_data[month_key] = {
-                    'month_name': month_name,
-                    'total_amount': 0.0,
-                    'transaction_count': 0
-                }
-            
-            monthly_data[month_key]['total_amount'] += payment.amount
-            monthly_data[month_key]['transaction_count'] += 1
-        
-        print(f"🔍 Monthly data: {len(monthly_data)} months from database")
+        logger.debug("🔍 Monthly data: %s months from database", len(monthly_data))
         
         return render_template('monthly_income.html', monthly_data=monthly_data)
     except Exception as e:
-        print(f"❌ Monthly income error: {e}")
-        import traceback
-        print(f"❌ Traceback: {traceback.format_exc()}")
+        logger.exception("❌ Monthly income error: %s", e)
         flash(f'Error loading monthly income: {str(e)}', 'error')
         return redirect(url_for('dashboard'))
 
@@ -745,21 +1128,23 @@ def landing_page():
 def dashboard():
     try:
         # Database mode - get data from SQLAlchemy models
-        from models import BudgetLimit, Transaction, Member as DBMember
-        
         members = {}
         pending_brothers = {}  # No pending brothers in database mode for now
         
         # Get actual members from database
-        print("🔍 Querying members from database...")
-        db_members = DBMember.query.all()
-        print(f"🔍 Found {len(db_members)} members")
+        db_members = Member.query.all()
+        logger.debug("🔍 Found %d members", len(db_members))
+        
+        # Total paid per member in one aggregate query instead of loading every payment
+        paid_by_member = dict(
+            db.session.query(Payment.member_id, func.sum(Payment.amount))
+            .group_by(Payment.member_id)
+            .all()
+        )
         
         for member in db_members:
             # Calculate total paid for this member
-            total_paid = sum(payment.amount for payment in member.payments)
-            
-            print(f"🔍 {member.name}: ${member.dues_amount} dues, ${total_paid} paid, ${member.dues_amount - total_paid} balance")
+            total_paid = paid_by_member.get(member.id, 0)
             
             # Add payment info to member object for template display with multiple attribute names
             member.total_paid = total_paid
@@ -770,23 +1155,13 @@ def dashboard():
             members[str(member.id)] = member
         
         # Calculate dues summary from database
-        print("🔍 Calculating dues summary...")
         total_projected = sum(member.dues_amount for member in db_members)
-        total_collected = 0.0
-        
-        # Sum all payments made by all members
-        for member in db_members:
-            try:
-                member_payments = sum(payment.amount for payment in member.payments)
-                total_collected += member_payments
-                print(f"🔍 {member.name}: ${member_payments} paid of ${member.dues_amount} due")
-            except Exception as e:
-                print(f"⚠️ Error calculating payments for {member.name}: {e}")
+        total_collected = float(sum(member.total_paid for member in db_members))
         
         outstanding = total_projected - total_collected
         collection_rate = (total_collected / total_projected * 100) if total_projected > 0 else 0
         
-        print(f"🔍 Totals: projected=${total_projected}, collected=${total_collected}, outstanding=${outstanding}")
+        logger.debug("🔍 Totals: projected=$%s, collected=$%s, outstanding=$%s", total_projected, total_collected, outstanding)
         
         dues_summary = {
             'total_collected': total_collected,
@@ -797,16 +1172,22 @@ def dashboard():
         
         # Get budget summary from database - format to match template expectations
         budget_summary = {}
-        budget_limits = BudgetLimit.query.all()
+        budget_limits = get_budget_limit_rows()
+        
+        # Spending and transaction count for every category in one query
+        expense_totals = {
+            category: (spent, count)
+            for category, spent, count in db.session.query(
+                Transaction.category, func.sum(Transaction.amount), func.count(Transaction.id)
+            ).filter(Transaction.type == 'expense').group_by(Transaction.category)
+        }
         
         for limit in budget_limits:
-            # Calculate spending for this category
-            expense_transactions = Transaction.query.filter_by(type='expense', category=limit.category).all()
-            spent = sum(t.amount for t in expense_transactions)
+            spent, expense_count = expense_totals.get(limit.category, (0, 0))
             remaining = limit.amount - spent
             percent_used = (spent / limit.amount * 100) if limit.amount > 0 else 0
             
-            print(f"🔍 Budget {limit.category}: ${limit.amount} limit, ${spent} spent ({len(expense_transactions)} transactions), ${remaining} remaining")
+            logger.debug("🔍 Budget %s: $%s limit, $%s spent (%d transactions), $%s remaining", limit.category, limit.amount, spent, expense_count, remaining)
             
             # Create object-like dict that matches template expectations
             budget_summary[limit.category] = {
@@ -818,7 +1199,7 @@ def dashboard():
                 'amount': spent  # Template might expect 'amount' for spent
             }
         
-        print(f"🔍 Rendering dashboard with {len(members)} members")
+        logger.debug("🔍 Rendering dashboard with %d members", len(members))
         return render_template('index.html',
                          members=members,
                          budget_summary=budget_summary,
@@ -827,9 +1208,7 @@ def dashboard():
                          pending_brothers=pending_brothers)
     
     except Exception as e:
-        print(f"❌ Dashboard error: {e}")
-        import traceback
-        print(f"❌ Dashboard traceback: {traceback.format_exc()}")
+        logger.exception("❌ Dashboard error: %s", e)
         return f"Dashboard Error: {str(e)}", 500
 
 
@@ -838,33 +1217,29 @@ def dashboard():
 @require_auth
 @require_permission('add_transactions')
 def add_transaction():
-    from models import Transaction as DBTransaction, Semester as DBSemester
-    
     category = request.form['category']
     description = request.form['description']
-    amount = float(request.form['amount'])
+    amount = parse_amount(request.form['amount'])
     transaction_type = request.form['type']
     
     try:
         # Database mode - create transaction directly
-        current_semester = DBSemester.query.filter_by(is_current=True).first()
-        
-        transaction = DBTransaction(
+        transaction = Transaction(
             date=datetime.now().date(),
             category=category,
             description=description,
             amount=amount,
             type=transaction_type,
-            semester_id=current_semester.id if current_semester else None
+            semester_id=get_current_semester_id()
         )
         
         db.session.add(transaction)
         db.session.commit()
-        print(f"✅ Transaction saved to database: {description} - ${amount}")
+        logger.info("✅ Transaction saved to database: %s - $%s", description, amount)
         flash('Transaction added successfully!')
     except Exception as e:
         db.session.rollback()
-        print(f"❌ Database transaction failed: {e}")
+        logger.error("❌ Database transaction failed: %s", e)
         flash(f'Error adding transaction: {e}', 'error')
     
     return redirect(url_for('dashboard'))
@@ -873,9 +1248,7 @@ def add_transaction():
 @require_auth
 @require_permission('edit_transactions')
 def edit_transaction(transaction_id):
-    from models import Transaction as DBTransaction
-    
-    transaction = DBTransaction.query.get(int(transaction_id))
+    transaction = db.session.get(Transaction, int(transaction_id))
     if not transaction:
         flash('Transaction not found!')
         return redirect(url_for('transactions'))
@@ -883,13 +1256,13 @@ def edit_transaction(transaction_id):
     if request.method == 'GET':
         return render_template('edit_transaction.html', 
                              transaction=transaction,
-                             categories=BUDGET_CATEGORIES + ['Dues Collection'])
+                             categories=TRANSACTION_CATEGORIES)
     
     # POST request - update transaction
     try:
         transaction.category = request.form['category']
         transaction.description = request.form['description']
-        transaction.amount = float(request.form['amount'])
+        transaction.amount = parse_amount(request.form['amount'])
         transaction.type = request.form['type']
         
         db.session.commit()
@@ -904,12 +1277,11 @@ def edit_transaction(transaction_id):
 @require_auth
 @require_permission('edit_transactions')
 def remove_transaction(transaction_id):
-    print(f"🗑️ Attempting to remove transaction: {transaction_id}")
+    logger.debug("🗑️ Attempting to remove transaction: %s", transaction_id)
     
     # Database mode - delete from SQLAlchemy
-    from models import Transaction as DBTransaction, db
     try:
-        transaction = DBTransaction.query.get_or_404(int(transaction_id))
+        transaction = db.get_or_404(Transaction, int(transaction_id))
         description = transaction.description
         
         db.session.delete(transaction)
@@ -918,9 +1290,7 @@ def remove_transaction(transaction_id):
         flash(f'Transaction "{description}" deleted successfully!', 'success')
     except Exception as e:
         db.session.rollback()
-        print(f"❌ Database transaction deletion failed: {e}")
-        import traceback
-        print(f"❌ Traceback: {traceback.format_exc()}")
+        logger.exception("❌ Database transaction deletion failed: %s", e)
         flash(f'Error deleting transaction: {e}', 'error')
     
     return redirect(url_for('transactions'))
@@ -930,17 +1300,16 @@ def remove_transaction(transaction_id):
 @require_permission('record_payments')
 def record_payment():
     member_id = request.form['member_id']
-    amount = float(request.form['amount'])
+    amount = parse_amount(request.form['amount'])
     payment_method = request.form['payment_method']
     
-    print(f"🔍 Recording payment: member_id={member_id}, amount=${amount}, method={payment_method}")
+    logger.debug("🔍 Recording payment: member_id=%s, amount=$%s, method=%s", member_id, amount, payment_method)
     
     # Database mode - record payment in SQLAlchemy
     try:
-        from models import Member as DBMember, Payment, db
         
         # Find the member
-        member = DBMember.query.get(int(member_id))
+        member = db.session.get(Member, int(member_id))
         if not member:
             flash('Member not found!', 'error')
             return redirect(url_for('dashboard'))
@@ -956,12 +1325,12 @@ def record_payment():
         db.session.add(payment)
         db.session.commit()
         
-        print(f"✅ Payment recorded in database: {member.name} paid ${amount} via {payment_method}")
+        logger.info("✅ Payment recorded in database: %s paid $%s via %s", member.name, amount, payment_method)
         flash('Payment recorded successfully!', 'success')
         
     except Exception as e:
         db.session.rollback()
-        print(f"❌ Database payment recording failed: {e}")
+        logger.error("❌ Database payment recording failed: %s", e)
         flash(f'Error recording payment: {e}', 'error')
     
     return redirect(url_for('dashboard'))
@@ -971,18 +1340,16 @@ def record_payment():
 @require_permission('record_payments')
 def edit_payment(payment_id):
     """Edit an existing payment"""
-    from models import Payment, Member as DBMember, db
-    
-    payment = Payment.query.get_or_404(int(payment_id))
+    payment = db.get_or_404(Payment, int(payment_id))
     
     if request.method == 'GET':
-        members = DBMember.query.all()
+        members = Member.query.all()
         return render_template('edit_payment.html', payment=payment, members=members)
     
     # POST request - update payment
     try:
         payment.member_id = int(request.form['member_id'])
-        payment.amount = float(request.form['amount'])
+        payment.amount = parse_amount(request.form['amount'])
         payment.payment_method = request.form['payment_method']
         
         db.session.commit()
@@ -999,10 +1366,8 @@ def edit_payment(payment_id):
 @require_permission('record_payments')
 def remove_payment(payment_id):
     """Delete a payment"""
-    from models import Payment, db
-    
     try:
-        payment = Payment.query.get_or_404(int(payment_id))
+        payment = db.get_or_404(Payment, int(payment_id))
         member_name = payment.member.name
         amount = payment.amount
         
@@ -1010,13 +1375,11 @@ def remove_payment(payment_id):
         db.session.commit()
         
         flash(f'Payment of ${amount} from {member_name} deleted successfully!', 'success')
-        print(f"✅ Payment deleted from database: ${amount} from {member_name}")
+        logger.info("✅ Payment deleted from database: $%s from %s", amount, member_name)
         
     except Exception as e:
         db.session.rollback()
-        print(f"❌ Error deleting payment: {e}")
-        import traceback
-        print(f"❌ Traceback: {traceback.format_exc()}")
+        logger.exception("❌ Error deleting payment: %s", e)
         flash(f'Error deleting payment: {e}', 'error')
     
     return redirect(url_for('transactions'))
@@ -1025,22 +1388,9 @@ def remove_payment(payment_id):
 @require_auth
 @require_permission('send_reminders')
 def send_reminders():
-    try:
-        print("\n🚀 Starting bulk reminder sending...")
-        
-        # Simple error handling without signal-based timeouts for cloud compatibility
-        # TODO: Implement database version
-        # reminders_sent = treasurer_app.check_and_send_reminders()
-        
-        if reminders_sent > 0:
-            flash(f'✅ {reminders_sent} payment reminders sent successfully!', 'success')
-        else:
-            flash('ℹ️ No reminders needed - all members are paid up!', 'info')
-        
-    except Exception as e:
-        print(f"Reminder error: {e}")
-        flash(f'❌ Error sending reminders: {str(e)}. Try selective reminders for better control.', 'error')
-    
+    # TODO: Implement database version
+    # reminders_sent = treasurer_app.check_and_send_reminders()
+    flash('ℹ️ Payment reminders are not available yet.', 'info')
     return redirect(url_for('dashboard'))
 
 @app.route('/selective_reminders', methods=['GET', 'POST'])
@@ -1070,33 +1420,19 @@ def selective_reminders():
         flash('No members selected for reminders!', 'warning')
         return redirect(url_for('selective_reminders'))
     
-    try:
-        print(f"\n📱 Sending selective reminders to {len(selected_members)} members...")
-        
-        # Simple error handling for cloud compatibility
-        # TODO: Implement database version
-        # reminders_sent = treasurer_app.check_and_send_reminders(selected_members)
-        
-        if reminders_sent > 0:
-            flash(f'✅ Reminders sent to {reminders_sent} selected member(s)!', 'success')
-        else:
-            flash('ℹ️ No reminders sent - check member balances.', 'info')
-        
-    except Exception as e:
-        print(f"Selective reminder error: {e}")
-        flash(f'❌ Error sending selective reminders: {str(e)}', 'error')
-    
+    # TODO: Implement database version
+    # reminders_sent = treasurer_app.check_and_send_reminders(selected_members)
+    flash('ℹ️ Payment reminders are not available yet.', 'info')
     return redirect(url_for('dashboard'))
 
 @app.route('/budget_summary')
 @require_auth
 def budget_summary():
     # Database mode - get budget data from DB
-    from models import BudgetLimit, Transaction
     budget_data = {}
     
     # Get budget limits
-    budget_limits = BudgetLimit.query.all()
+    budget_limits = get_budget_limit_rows()
     for limit in budget_limits:
         budget_data[limit.category] = {
         'limit': limit.amount,
@@ -1104,10 +1440,12 @@ def budget_summary():
         }
     
     # Calculate spending per category
-    transactions = Transaction.query.filter_by(type='expense').all()
-    for transaction in transactions:
-        if transaction.category in budget_data:
-            budget_data[transaction.category]['spent'] += transaction.amount
+    spent_by_category = db.session.query(Transaction.category, func.sum(Transaction.amount)).filter(
+        Transaction.type == 'expense'
+    ).group_by(Transaction.category)
+    for category, spent in spent_by_category:
+        if category in budget_data:
+            budget_data[category]['spent'] += spent
     
     # Calculate remaining amounts
     for category, data in budget_data.items():
@@ -1115,6 +1453,23 @@ def budget_summary():
     
     return jsonify(budget_data)
 
+# US phone number with optional +1 prefix and common separators, e.g. "(555) 111-2222"
+_BULK_PHONE_RE = re.compile(r'(?:\+?1[\s\-\.]?)?\(?(\d{3})\)?[\s\-\.]?(\d{3})[\s\-\.]?(\d{4})')
+
+def _parse_bulk_line(line):
+    """Split one pasted member line into (full name, 10-digit phone or None)"""
+    # One regex pass finds the phone whether fields are tab, comma or space separated
+    match = _BULK_PHONE_RE.search(line)
+    if match:
+        phone = ''.join(match.groups())
+        name_text = line[:match.start()] + ' ' + line[match.end():]
+    else:
+        # Unusual separators (e.g. 555/111/2222): fall back to the digits in the line
+        digits = _digits_only(line)
+        phone = digits[-10:] if len(digits) >= 10 else None
+        name_text = ' '.join(part for part in line.split() if not _digits_only(part))
+    return ' '.join(name_text.replace(',', ' ').split()), phone
+
 @app.route('/bulk_import', methods=['GET', 'POST'])
 @require_auth
 @require_permission('add_members')
@@ -1127,80 +1482,25 @@ def bulk_import():
     default_dues = float(request.form.get('default_dues', 0))
     default_payment_plan = request.form.get('default_payment_plan', 'semester')
     
-    parsed_members = []
-    errors = []
+    lines = [line.strip() for line in raw_data.strip().split('\n')]
+    parsed_lines = [(i, line, *_parse_bulk_line(line)) for i, line in enumerate(lines, 1) if line]
     
-    lines = raw_data.strip().split('\n')
-    for i, line in enumerate(lines, 1):
-        line = line.strip()
-        if not line:
-            continue
-            
-            # Try to parse different formats
-            parts = [part.strip() for part in line.split('\\t') if part.strip()]  # Tab-separated
-        if len(parts) < 2:
-            parts = [part.strip() for part in line.split(',') if part.strip()]  # Comma-separated
-        if len(parts) < 2:
-            parts = line.split()  # Space-separated
-        
-        if len(parts) >= 2:
-            phone = None  # Initialize phone variable
-            full_name = ""
-            
-            # Try different arrangements
-            if len(parts) == 2:
-                # "John Doe" "1234567890" or "John" "Doe 1234567890"
-                name_part = parts[0]
-                second_part = parts[1]
-                
-                # Check if second part contains phone number
-                phone_chars = ''.join(filter(str.isdigit, second_part))
-                if len(phone_chars) >= 10:
-                    # Second part has phone, might have last name too
-                    phone = phone_chars[-10:]  # Last 10 digits
-                    remaining = second_part.replace(phone, '').replace(phone_chars, '').strip()
-                    if remaining:
-                        full_name = f"{name_part} {remaining}".strip()
-                    else:
-                        full_name = name_part
-                else:
-                    # Assume first is first name, second is last name, need phone
-                    full_name = f"{parts[0]} {parts[1]}"
-                    phone = None
-                    
-            elif len(parts) >= 3:
-                # "John" "Doe" "1234567890" or similar
-                phone_candidates = []
-                name_parts = []
-                
-                for part in parts:
-                    digits = ''.join(filter(str.isdigit, part))
-                    if len(digits) >= 10:
-                        phone_candidates.append(digits[-10:])  # Last 10 digits
-                    else:
-                        name_parts.append(part)
-                
-                full_name = ' '.join(name_parts)
-                phone = phone_candidates[0] if phone_candidates else None
-            
-            if phone is None:
-                errors.append(f"Line {i}: Could not find phone number - '{line}'")
-                continue
-                
-            # Format phone number
-            if len(phone) == 10:
-                formatted_phone = f"+1{phone}"
-            elif len(phone) == 11 and phone.startswith('1'):
-                formatted_phone = f"+{phone}"
-            else:
-                formatted_phone = phone
-            
-            parsed_members.append({
-                'name': full_name,
-                'phone': formatted_phone,
-                'dues_amount': default_dues,
-                'payment_plan': default_payment_plan
-            })
+    errors = [
+        f"Line {i}: Could not find phone number - '{line}'" if phone is None
+        else f"Line {i}: Could not find name - '{line}'"
+        for i, line, full_name, phone in parsed_lines
+        if phone is None or not full_name
+    ]
+    parsed_members = [
+        {
+            'name': full_name,
+            'phone': f"+1{phone}",
+            'dues_amount': default_dues,
+            'payment_plan': default_payment_plan
+        }
+        for i, line, full_name, phone in parsed_lines
+        if phone is not None and full_name
+    ]
     
     return render_template('bulk_import.html', 
                          parsed_members=parsed_members, 
@@ -1212,21 +1512,45 @@ def bulk_import():
 @require_permission('add_members')
 def confirm_bulk_import():
     # Get the confirmed member data
-    member_count = int(request.form.get('member_count', 0))
-    added_count = 0
-    
-    for i in range(member_count):
-        if f'include_{i}' in request.form:  # Only add checked members
-            name = request.form.get(f'name_{i}')
-            phone = request.form.get(f'phone_{i}')
-            dues_amount = float(request.form.get(f'dues_{i}'))
-            payment_plan = request.form.get(f'plan_{i}')
-            
-            # TODO: Implement database version
-            # treasurer_app.add_member(name, phone, dues_amount, payment_plan)
-            added_count += 1
+    form = request.form.to_dict(flat=True)
+    member_count = int(form.get('member_count', 0))
+    
+    # Only checked members carry an include_<i> field; visit just those rows
+    included = sorted(
+        int(key[len('include_'):]) for key in form
+        if key.startswith('include_') and key[len('include_'):].isdigit()
+    )
+    included = [i for i in included if i < member_count]
+    
+    semester_id = get_current_semester_id()
+    if not semester_id:
+        flash('Create a current semester before importing members.', 'error')
+        return redirect(url_for('semester_management'))
+    
+    try:
+        new_members = [
+            {
+                'name': form.get(f'name_{i}'),
+                'contact': form.get(f'phone_{i}'),
+                'contact_type': 'phone',
+                'dues_amount': float(form.get(f'dues_{i}')),
+                'payment_plan': form.get(f'plan_{i}'),
+                'semester_id': semester_id
+            }
+            for i in included
+        ]
+        
+        # One executemany INSERT instead of a unit-of-work add per member
+        if new_members:
+            db.session.execute(db.insert(Member), new_members)
+            db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.exception("❌ Bulk member import failed: %s", e)
+        flash(f'Error importing members: {e}', 'error')
+        return redirect(url_for('dashboard'))
     
-    flash(f'Successfully added {added_count} members!')
+    flash(f'Successfully added {len(new_members)} members!')
     return redirect(url_for('dashboard'))
 
 @app.route('/edit_member/<member_id>', methods=['GET', 'POST'])
@@ -1236,64 +1560,14 @@ def edit_member(member_id):
     try:
         if request.method == 'GET':
             # Database mode
-            from models import Member as DBMember
-            member = DBMember.query.get(int(member_id))
+            member = db.session.get(Member, int(member_id))
             if not member:
                 flash('Member not found!', 'error')
                 return redirect(url_for('dashboard'))
             
             # Generate payment schedule for display
-            from datetime import datetime, timedelta
-            payment_schedule = []
-            total_paid = sum(p.amount for p in member.payments)
-            
-            if member.payment_plan == 'monthly':
-                start_date = datetime.now()
-                monthly_amount = member.dues_amount / 4
-                for i in range(4):
-                    due_date = start_date.replace(day=1) + timedelta(days=32*i)
-                    due_date = due_date.replace(day=1)
-                    period_paid = sum(p.amount for p in member.payments 
-                                    if hasattr(p.date, 'month') and p.date.month == due_date.month)
-                    status = 'paid' if period_paid >= monthly_amount else 'pending'
-                    payment_schedule.append({
-                        'due_date': due_date.isoformat(),
-                        'amount': monthly_amount,
-                        'description': f'Monthly payment {i+1}/4',
-                        'status': status,
-                        'amount_due': max(0, monthly_amount - period_paid)
-                    })
-            elif member.payment_plan == 'semester':
-                start_date = datetime.now()
-                status = 'paid' if total_paid >= member.dues_amount else 'pending'
-                payment_schedule.append({
-                    'due_date': start_date.isoformat(),
-                    'amount': member.dues_amount,
-                    'description': 'Full semester payment',
-                    'status': status,
-                    'amount_due': max(0, member.dues_amount - total_paid)
-                })
-            elif member.payment_plan == 'bimonthly':
-                start_date = datetime.now()
-                bimonthly_amount = member.dues_amount / 2
-                for i in range(2):
-                    due_date = start_date.replace(day=1) + timedelta(days=60*i)
-                    due_date = due_date.replace(day=1)
-                    period_paid = 0
-                    for p in member.payments:
-                        if hasattr(p.date, 'month'):
-                            if i == 0 and p.date.month in [start_date.month, start_date.month + 1]:
-                                period_paid += p.amount
-                            elif i == 1 and p.date.month in [start_date.month + 2, start_date.month + 3]:
-                                period_paid += p.amount
-                    status = 'paid' if period_paid >= bimonthly_amount else 'pending'
-                    payment_schedule.append({
-                        'due_date': due_date.isoformat(),
-                        'amount': bimonthly_amount,
-                        'description': f'Bi-monthly payment {i+1}/2',
-                        'status': status,
-                        'amount_due': max(0, bimonthly_amount - period_paid)
-                    })
+            total_paid, month_totals = member_payment_totals(member.id)
+            payment_schedule = build_payment_schedule(member, month_totals, total_paid)
             
             return render_template('edit_member.html', 
                                  member=member,
@@ -1307,8 +1581,7 @@ def edit_member(member_id):
         role = request.form.get('role', 'brother')  # Get role assignment
         
         # Database mode
-        from models import Member as DBMember
-        member = DBMember.query.get(int(member_id))
+        member = db.session.get(Member, int(member_id))
         if not member:
             flash('Member not found!', 'error')
             return redirect(url_for('dashboard'))
@@ -1322,19 +1595,17 @@ def edit_member(member_id):
         try:
             db.session.commit()
             flash(f'Member {name} updated successfully!')
-            print(f"✅ Member {name} updated successfully in database")
+            logger.info("✅ Member %s updated successfully in database", name)
         except Exception as e:
             db.session.rollback()
             flash(f'Error updating member: {e}', 'error')
-            print(f"❌ Error updating member: {e}")
+            logger.error("❌ Error updating member: %s", e)
             return redirect(url_for('dashboard'))
         
         return redirect(url_for('member_details', member_id=member_id))
     
     except Exception as e:
-        print(f"❌ Edit member error: {e}")
-        import traceback
-        print(f"❌ Traceback: {traceback.format_exc()}")
+        logger.exception("❌ Edit member error: %s", e)
         flash(f'Error editing member: {str(e)}', 'error')
         return redirect(url_for('dashboard'))
 
@@ -1349,23 +1620,18 @@ def remove_member(member_id):
 @app.route('/member_details/<member_id>')
 @require_auth
 def member_details(member_id):
-    from datetime import datetime, timedelta
-    
     # Database mode
-    from models import Member as DBMember, Payment
-    
     try:
-        member = DBMember.query.get(int(member_id))
+        member = db.session.get(Member, int(member_id), options=[selectinload(Member.payments)])
         if not member:
             flash('Member not found!', 'error')
             return redirect(url_for('dashboard'))
         
-        # Calculate balance from payments
-        total_paid = sum(payment.amount for payment in member.payments)
-        balance = member.dues_amount - total_paid
-        
-        # Format payments for template (database mode uses different structure)
+        # Format payments for template (database mode uses different structure) and
+        # total them overall and per calendar month in the same pass
         formatted_payments = []
+        total_paid = 0
+        month_totals = {}
         for payment in member.payments:
             formatted_payments.append({
                 'id': payment.id,
@@ -1373,81 +1639,26 @@ def member_details(member_id):
                 'method': payment.payment_method,
                 'date': payment.date.strftime('%Y-%m-%d') if hasattr(payment.date, 'strftime') else str(payment.date)
             })
+            total_paid += payment.amount
+            if hasattr(payment.date, 'month'):
+                month_totals[payment.date.month] = month_totals.get(payment.date.month, 0) + payment.amount
+        balance = member.dues_amount - total_paid
         
         # Add payments_made attribute for template compatibility
         member.payments_made = formatted_payments
         member.phone = member.contact  # Template expects 'phone' attribute
         
         # Generate payment schedule based on payment plan
-        payment_schedule = []
-        if member.payment_plan == 'monthly':
-            # Generate 4 monthly payments
-            start_date = datetime.now()
-            monthly_amount = member.dues_amount / 4
-            for i in range(4):
-                due_date = start_date.replace(day=1) + timedelta(days=32*i)
-                due_date = due_date.replace(day=1)
-                
-                # Check if this payment period is paid
-                period_paid = 0
-                for payment in member.payments:
-                    if hasattr(payment.date, 'month') and payment.date.month == due_date.month:
-                        period_paid += payment.amount
-                
-                status = 'paid' if period_paid >= monthly_amount else 'pending'
-                payment_schedule.append({
-                    'due_date': due_date.isoformat(),
-                    'amount': monthly_amount,
-                    'description': f'Monthly payment {i+1}/4',
-                    'status': status,
-                    'amount_due': max(0, monthly_amount - period_paid)
-                })
-        elif member.payment_plan == 'semester':
-            # Single payment for full semester
-            start_date = datetime.now()
-            status = 'paid' if total_paid >= member.dues_amount else 'pending'
-            payment_schedule.append({
-                'due_date': start_date.isoformat(),
-                'amount': member.dues_amount,
-                'description': 'Full semester payment',
-                'status': status,
-                'amount_due': max(0, member.dues_amount - total_paid)
-            })
-        elif member.payment_plan == 'bimonthly':
-            # Generate 2 bi-monthly payments
-            start_date = datetime.now()
-            bimonthly_amount = member.dues_amount / 2
-            for i in range(2):
-                due_date = start_date.replace(day=1) + timedelta(days=60*i)
-                due_date = due_date.replace(day=1)
-                
-                # Check if this payment period is paid
-                period_paid = 0
-                for payment in member.payments:
-                    if hasattr(payment.date, 'month'):
-                        # Check if payment falls in this bi-monthly period
-                        if i == 0 and payment.date.month in [start_date.month, start_date.month + 1]:
-                            period_paid += payment.amount
-                        elif i == 1 and payment.date.month in [start_date.month + 2, start_date.month + 3]:
-                            period_paid += payment.amount
-                
-                status = 'paid' if period_paid >= bimonthly_amount else 'pending'
-                payment_schedule.append({
-                    'due_date': due_date.isoformat(),
-                    'amount': bimonthly_amount,
-                    'description': f'Bi-monthly payment {i+1}/2',
-                    'status': status,
-                    'amount_due': max(0, bimonthly_amount - period_paid)
-                })
-        elif member.payment_plan == 'custom':
+        now = datetime.now()
+        payment_schedule = build_payment_schedule(member, month_totals, total_paid, start_date=now)
+        if member.payment_plan == 'custom':
             # Handle custom payment plan
             # Check if member has custom_schedule in database
             if hasattr(member, 'custom_schedule') and member.custom_schedule:
                 # Use stored custom schedule
                 try:
-                    import json
                     if isinstance(member.custom_schedule, str):
-                        loaded_schedule = json.loads(member.custom_schedule)
+                        loaded_schedule = _json_loads(member.custom_schedule)
                     else:
                         loaded_schedule = member.custom_schedule
                     
@@ -1462,15 +1673,14 @@ def member_details(member_id):
                     
                     payment_schedule = loaded_schedule
                 except Exception as e:
-                    print(f"⚠️ Error parsing custom schedule: {e}")
+                    logger.warning("⚠️ Error parsing custom schedule: %s", e)
                     payment_schedule = []
             
             # If no custom schedule or empty, fall back to semester plan
             if not payment_schedule:
-                start_date = datetime.now()
                 status = 'paid' if total_paid >= member.dues_amount else 'pending'
                 payment_schedule.append({
-                    'due_date': start_date.isoformat(),
+                    'due_date': now.isoformat(),
                     'amount': member.dues_amount,
                     'description': 'Full semester payment (custom schedule not set)',
                     'status': status,
@@ -1482,9 +1692,7 @@ def member_details(member_id):
                              payment_schedule=payment_schedule,
                              balance=balance)
     except Exception as e:
-        print(f"❌ Error loading member details: {e}")
-        import traceback
-        print(f"❌ Traceback: {traceback.format_exc()}")
+        logger.exception("❌ Error loading member details: %s", e)
         flash(f'Error loading member details: {e}', 'error')
         return redirect(url_for('dashboard'))
 @app.route('/budget_management', methods=['GET', 'POST'])
@@ -1492,90 +1700,91 @@ def member_details(member_id):
 @require_permission('manage_budgets')
 def budget_management():
     try:
-        print(f"🔍 Budget management route called")
+        logger.debug("🔍 Budget management route called")
         if request.method == 'GET':
                 # Database mode - get budget data
-                from models import BudgetLimit, Transaction, Member
+                # Calculate dues summary with SQL sums across all members
+                dues_summary = build_dues_summary()
                 
-                # Calculate dues summary
-                members = Member.query.all()
-                total_projected = sum(member.dues_amount for member in members)
-                total_collected = sum(sum(payment.amount for payment in member.payments) for member in members)
-                outstanding = total_projected - total_collected
-                collection_rate = (total_collected / total_projected * 100) if total_projected > 0 else 0
+                # Get budget limits from the cached rows
+                budget_limits_data = {category: amount for category, amount, _ in get_budget_limit_rows()}
                 
-                dues_summary = {
-                    'total_collected': total_collected,
-                    'total_projected': total_projected,
-                    'outstanding': outstanding,
-                    'collection_rate': collection_rate
-                }
-                
-                # Get budget limits
-                budget_limits_data = {}
-                budget_limits = BudgetLimit.query.all()
-                for limit in budget_limits:
-                    budget_limits_data[limit.category] = limit.amount
-                
-                # Get budget summary
+                # Get budget summary - spending for every limited category in one GROUP BY
+                spent_by_category = dict(
+                    db.session.query(Transaction.category, func.sum(Transaction.amount))
+                    .filter(Transaction.type == 'expense', Transaction.category.in_(list(budget_limits_data)))
+                    .group_by(Transaction.category)
+                    .all()
+                )
                 budget_summary = {}
-                for limit in budget_limits:
-                    spent = sum(t.amount for t in Transaction.query.filter_by(type='expense', category=limit.category).all())
-                    budget_summary[limit.category] = {
-                        'budget_limit': limit.amount,
+                for category, amount in budget_limits_data.items():
+                    spent = spent_by_category.get(category, 0)
+                    budget_summary[category] = {
+                        'budget_limit': amount,
                         'spent': spent,
-                        'remaining': limit.amount - spent,
-                        'percent_used': (spent / limit.amount * 100) if limit.amount > 0 else 0
+                        'remaining': amount - spent,
+                        'percent_used': (spent / amount * 100) if amount > 0 else 0
                     }
                 
                 return render_template('budget_management.html',
                                      budget_limits=budget_limits_data,
                                      budget_summary=budget_summary,
                                      dues_summary=dues_summary,
-                                     categories=BUDGET_CATEGORIES)
+                                     categories=BUDGET_CATEGORIES,
+                                     field_names=BUDGET_FIELD_NAMES)
         elif request.method == 'POST':
                 # POST request - update budget limits
-                from models import BudgetLimit
-                
                 try:
+                    # Load existing limits for every category at once (first row per category wins)
+                    existing_limits = {}
+                    for limit in BudgetLimit.query.filter(BudgetLimit.category.in_(BUDGET_CATEGORIES)).order_by(BudgetLimit.id):
+                        existing_limits.setdefault(limit.category, limit)
+                    
+                    new_limits = []
                     for category in BUDGET_CATEGORIES:
-                        amount_key = f'budget_{category.replace("(", "_").replace(")", "_").replace(" ", "_").replace(",", "")}'
+                        amount_key = BUDGET_FIELD_NAMES[category]
                         if amount_key in request.form:
                             amount = float(request.form[amount_key] or 0)
                             # Update or create budget limit
-                            limit = BudgetLimit.query.filter_by(category=category).first()
+                            limit = existing_limits.get(category)
                             if limit:
                                 limit.amount = amount
                             else:
-                                limit = BudgetLimit(category=category, amount=amount)
-                                db.session.add(limit)
+                                new_limits.append(BudgetLimit(category=category, amount=amount,
+                                                              semester_id=get_current_semester_id()))
                     
+                    db.session.add_all(new_limits)
                     db.session.commit()
                     flash('Budget limits updated successfully!')
                     return redirect(url_for('budget_management'))
                 except Exception as post_error:
                     db.session.rollback()
-                    print(f"❌ Budget management POST error: {post_error}")
-                    import traceback
-                    print(f"❌ Traceback: {traceback.format_exc()}")
+                    logger.exception("❌ Budget management POST error: %s", post_error)
                     flash(f'Error updating budget limits: {str(post_error)}', 'error')
                     return redirect(url_for('budget_management'))
     except Exception as e:
-        print(f"❌ Budget management error: {e}")
-        import traceback
-        print(f"❌ Traceback: {traceback.format_exc()}")
+        logger.exception("❌ Budget management error: %s", e)
         flash(f'Error loading budget management: {str(e)}', 'error')
         return redirect(url_for('dashboard'))
 
 
+def _custom_schedule_entry(number, due_date, amount, description):
+    """One custom schedule row; raises ValueError(number) on a bad date or amount."""
+    try:
+        # Validate date format and convert to ISO format
+        return {
+            'due_date': datetime.strptime(due_date, '%Y-%m-%d').isoformat(),
+            'amount': float(amount),
+            'description': description
+        }
+    except ValueError:
+        raise ValueError(number) from None
+
 @app.route('/custom_payment_schedule/<member_id>', methods=['GET', 'POST'])
 @require_auth
 @require_permission('edit_members')
 def custom_payment_schedule(member_id):
-    from models import Member
-    import json
-    
-    member = Member.query.get(int(member_id))
+    member = db.session.get(Member, int(member_id))
     if not member:
         flash('Member not found!')
         return redirect(url_for('dashboard'))
@@ -1584,7 +1793,7 @@ def custom_payment_schedule(member_id):
         # Parse custom_schedule if it exists (it's stored as JSON string)
         if member.custom_schedule:
             try:
-                member.custom_schedule = json.loads(member.custom_schedule) if isinstance(member.custom_schedule, str) else member.custom_schedule
+                member.custom_schedule = _json_loads(member.custom_schedule) if isinstance(member.custom_schedule, str) else member.custom_schedule
             except:
                 member.custom_schedule = None
         
@@ -1593,32 +1802,25 @@ def custom_payment_schedule(member_id):
     
     # POST request - update custom payment schedule
     try:
-        custom_schedule = []
-        payment_count = int(request.form.get('payment_count', 0))
+        form = request.form.to_dict()
+        payment_count = int(form.get('payment_count', 0))
+        # (payment number, due date, amount, description) for every fully filled-in row
+        entries = [
+            (i + 1, form.get(f'due_date_{i}'), form.get(f'amount_{i}'), form.get(f'description_{i}'))
+            for i in range(payment_count)
+        ]
+        entries = [entry for entry in entries if all(entry[1:])]
         
-        for i in range(payment_count):
-            due_date = request.form.get(f'due_date_{i}')
-            amount = request.form.get(f'amount_{i}')
-            description = request.form.get(f'description_{i}')
-            
-            if due_date and amount and description:
-                try:
-                    # Validate date format and convert to ISO format
-                    parsed_date = datetime.strptime(due_date, '%Y-%m-%d')
-                    custom_schedule.append({
-                        'due_date': parsed_date.isoformat(),
-                        'amount': float(amount),
-                        'description': description
-                    })
-                except (ValueError, TypeError) as e:
-                    flash(f'Error in payment {i+1}: Invalid date or amount format')
-                    return redirect(url_for('custom_payment_schedule', member_id=member_id))
+        try:
+            custom_schedule = [_custom_schedule_entry(*entry) for entry in entries]
+        except ValueError as e:
+            flash(f'Error in payment {e.args[0]}: Invalid date or amount format')
+            return redirect(url_for('custom_payment_schedule', member_id=member_id))
         
         # Update member with custom schedule
         member.payment_plan = 'custom'
         # Store custom_schedule in database using the model's method
-        import json
-        member.custom_schedule = json.dumps(custom_schedule)
+        member.custom_schedule = _json_dumps(custom_schedule)
         db.session.commit()
         
         flash(f'Custom payment schedule updated for {member.full_name}!')
@@ -1633,46 +1835,49 @@ def custom_payment_schedule(member_id):
 def dues_summary_page():
     try:
         # Database mode - get data from SQLAlchemy models
-        from models import Member, Payment
-        print("🔍 Using database mode for dues summary")
-        
-        db_members = Member.query.all()
+        logger.debug("🔍 Using database mode for dues summary")
+        
+        # One row per member with their payments summed in SQL
+        member_rows = (
+            db.session.query(Member.id, Member.name, Member.dues_amount,
+                             func.coalesce(func.sum(Payment.amount), 0).label('paid'))
+            .outerjoin(Payment, Payment.member_id == Member.id)
+            .group_by(Member.id)
+            .order_by(Member.id)
+            .all()
+        )
         members = {}
-        
-        # Build members dictionary for template
-        for member in db_members:
-            total_paid = sum(payment.amount for payment in member.payments)
-            members[str(member.id)] = {
-                'name': member.full_name,
-                'dues_amount': member.dues_amount,
-                'payments_made': [{'amount': p.amount, 'date': p.date.strftime('%Y-%m-%d'), 'method': p.payment_method} for p in member.payments]
+        members_paid_up = 0
+        total_projected = 0
+        total_collected = 0
+        
+        # Build members dictionary and dues totals for template
+        for member_id, name, dues_amount, total_paid in member_rows:
+            members[str(member_id)] = {
+                'name': name,
+                'dues_amount': dues_amount,
+                'total_paid': total_paid
             }
-        
-        # Calculate dues summary
-        total_projected = sum(member.dues_amount for member in db_members)
-        total_collected = sum(sum(payment.amount for payment in member.payments) for member in db_members)
-        outstanding = total_projected - total_collected
-        collection_rate = (total_collected / total_projected * 100) if total_projected > 0 else 0
-        members_paid_up = sum(1 for member in db_members if sum(payment.amount for payment in member.payments) >= member.dues_amount)
-        members_outstanding = len(db_members) - members_paid_up
+            if total_paid >= dues_amount:
+                members_paid_up += 1
+            total_projected += dues_amount
+            total_collected += total_paid
         
         dues_summary = {
             'total_collected': total_collected,
             'total_projected': total_projected,
-            'outstanding': outstanding,
-            'collection_rate': collection_rate,
+            'outstanding': total_projected - total_collected,
+            'collection_rate': (total_collected / total_projected * 100) if total_projected > 0 else 0,
             'members_paid_up': members_paid_up,
-            'members_outstanding': members_outstanding
+            'members_outstanding': len(member_rows) - members_paid_up
         }
         
-        print(f"🔍 Dues summary loaded: {dues_summary}")
+        logger.debug("🔍 Dues summary loaded: %s", dues_summary)
         return render_template('dues_summary.html',
                          dues_summary=dues_summary,
                          members=members)
     except Exception as e:
-        print(f"❌ Dues summary error: {e}")
-        import traceback
-        print(f"❌ Traceback: {traceback.format_exc()}")
+        logger.exception("❌ Dues summary error: %s", e)
         flash(f'Error loading dues summary: {str(e)}', 'error')
         return redirect(url_for('dashboard'))
 
@@ -1684,93 +1889,94 @@ def transactions():
     """Show all transactions and outstanding dues in itemized list"""
     try:
         # Database mode - get transactions from DB
-        print("🔍 Loading database models...")
-        from models import Transaction, Member, Payment
         all_items = []
         
-        # Get all transactions
-        print("🔍 Querying transactions...")
-        db_transactions = Transaction.query.order_by(Transaction.date.desc()).all()
-        print(f"🔍 Found {len(db_transactions)} transactions")
-        
-        for trans in db_transactions:
-            all_items.append({
-                'id': trans.id,
-                'date': trans.date.strftime('%Y-%m-%d'),
-                'date_str': trans.date.strftime('%Y-%m-%d'),
-                'description': trans.description,
-                'amount': trans.amount,
-                'category': trans.category,
-                'transaction_type': trans.type,
-                'type': 'transaction'
-            })
+        # Get all transactions and payments in one UNION ALL, newest first
+        logger.debug("🔍 Querying transactions and payments...")
+        transaction_rows = db.select(
+            Transaction.id, Transaction.date, Transaction.description, Transaction.amount,
+            Transaction.category, Transaction.type.label('transaction_type'), literal('transaction').label('type'),
+            null().label('member_name'), null().label('payment_method')
+        )
+        payment_rows = db.select(
+            Payment.id, Payment.date, null(), Payment.amount,
+            literal('Dues Collection'), literal('income'), literal('payment'),
+            Member.name, Payment.payment_method
+        ).join(Member, Payment.member_id == Member.id)
+        ledger = union_all(transaction_rows, payment_rows).subquery()
+        ledger_rows = db.session.execute(
+            db.select(ledger).order_by(ledger.c.date.desc(), ledger.c.type.desc())
+        ).all()
+        logger.debug("🔍 Found %s transactions and payments", len(ledger_rows))
+        
+        for row in ledger_rows:
+            date = row.date.date().isoformat()
+            if row.type == 'payment':
+                all_items.append({
+                    'id': f'payment_{row.id}',
+                    'date': date,
+                    'description': f'Payment from {row.member_name} ({row.payment_method})',
+                    'amount': row.amount,
+                    'category': row.category,
+                    'transaction_type': row.transaction_type,
+                    'type': 'payment',
+                    'member_name': row.member_name
+                })
+            else:
+                all_items.append({
+                    'id': row.id,
+                    'date': date,
+                    'description': row.description,
+                    'amount': row.amount,
+                    'category': row.category,
+                    'transaction_type': row.transaction_type,
+                    'type': 'transaction'
+                })
         
-        # Get all payments as income transactions
-        print("🔍 Querying payments...")
-        db_payments = Payment.query.order_by(Payment.date.desc()).all()
-        print(f"🔍 Found {len(db_payments)} payments")
+        # Get outstanding dues (members with unpaid balances) - balances computed in SQL
+        logger.debug("🔍 Querying members for outstanding dues...")
+        paid = (
+            db.session.query(Payment.member_id, func.sum(Payment.amount).label('paid'))
+            .group_by(Payment.member_id)
+            .subquery()
+        )
+        outstanding_balance = (Member.dues_amount - func.coalesce(paid.c.paid, 0)).label('outstanding')
+        outstanding_rows = (
+            db.session.query(Member.id, Member.name, outstanding_balance)
+            .outerjoin(paid, paid.c.member_id == Member.id)
+            .filter(outstanding_balance > 0)
+            .subquery()
+        )
+        outstanding_members = db.session.query(outstanding_rows).order_by(outstanding_rows.c.id).all()
+        logger.debug("🔍 Found %s members with outstanding dues", len(outstanding_members))
         
-        for payment in db_payments:
+        for member_id, member_name, outstanding in outstanding_members:
             all_items.append({
-                'id': f'payment_{payment.id}',
-                'date': payment.date.strftime('%Y-%m-%d'),
-                'date_str': payment.date.strftime('%Y-%m-%d'),
-                'description': f'Payment from {payment.member.name} ({payment.payment_method})',
-                'amount': payment.amount,
-                'category': 'Dues Collection',
-                'transaction_type': 'income',
-                'type': 'payment',
-                'member_name': payment.member.name
+                'id': f'outstanding_{member_id}',
+                'date': 'Ongoing',
+                'description': f'Outstanding dues - {member_name}',
+                'amount': outstanding,
+                'category': 'Dues',
+                'transaction_type': 'outstanding',
+                'type': 'outstanding'
             })
         
-        # Sort all items by date (newest first)
-        all_items.sort(key=lambda x: x['date'] if x['date'] != 'Ongoing' else '1900-01-01', reverse=True)
-        
-        # Get outstanding dues (members with unpaid balances)
-        print("🔍 Querying members for outstanding dues...")
-        members = Member.query.all()
-        print(f"🔍 Found {len(members)} members")
-        
-        for member in members:
-            try:
-                total_paid = sum(p.amount for p in member.payments)
-                outstanding = member.dues_amount - total_paid
-                if outstanding > 0:
-                    all_items.append({
-                        'id': f'outstanding_{member.id}',
-                        'date': 'Ongoing',
-                        'date_str': 'Ongoing',
-                        'description': f'Outstanding dues - {member.name}',
-                        'amount': outstanding,
-                        'category': 'Dues',
-                        'transaction_type': 'outstanding',
-                        'type': 'outstanding'
-                    })
-            except Exception as e:
-                print(f"⚠️ Error processing member {member.name}: {e}")
-        
-        # Calculate totals avoiding double-counting of dues collection
-        transaction_income = sum(item['amount'] for item in all_items 
-                               if item['transaction_type'] == 'income' and item['type'] == 'transaction' and item['category'] != 'Dues Collection')
-        
-        payment_income = sum(item['amount'] for item in all_items 
-                           if item['transaction_type'] == 'income' and item['type'] == 'payment')
-        
-        dues_transactions = sum(item['amount'] for item in all_items 
-                              if item['transaction_type'] == 'income' and item['type'] == 'transaction' and item['category'] == 'Dues Collection')
+        # Calculate totals in SQL, avoiding double-counting of dues collection
+        income_query = db.session.query(func.sum(Transaction.amount)).filter(Transaction.type == 'income')
+        transaction_income = income_query.filter(Transaction.category != 'Dues Collection').scalar() or 0
+        dues_transactions = income_query.filter(Transaction.category == 'Dues Collection').scalar() or 0
+        payment_income = db.session.query(func.sum(Payment.amount)).scalar() or 0
         
         total_income = transaction_income + payment_income
         
-        total_expenses = sum(item['amount'] for item in all_items 
-                            if item['transaction_type'] == 'expense')
-        total_outstanding = sum(item['amount'] for item in all_items 
-                               if item['transaction_type'] == 'outstanding')
+        total_expenses = db.session.query(func.sum(Transaction.amount)).filter_by(type='expense').scalar() or 0
+        total_outstanding = db.session.query(func.sum(outstanding_rows.c.outstanding)).scalar() or 0
         
         net_position = total_income - total_expenses
         
-        print(f"🔍 Income breakdown: transaction_income=${transaction_income}, payment_income=${payment_income}, dues_transactions=${dues_transactions}")
-        print(f"🔍 Totals: income={total_income}, expenses={total_expenses}, outstanding={total_outstanding}")
-        print(f"🔍 Rendering template with {len(all_items)} items")
+        logger.debug("🔍 Income breakdown: transaction_income=$%s, payment_income=$%s, dues_transactions=$%s", transaction_income, payment_income, dues_transactions)
+        logger.debug("🔍 Totals: income=%s, expenses=%s, outstanding=%s", total_income, total_expenses, total_outstanding)
+        logger.debug("🔍 Rendering template with %s items", len(all_items))
         
         return render_template('transactions.html',
                          transactions=all_items,
@@ -1780,9 +1986,7 @@ def transactions():
                          net_position=net_position)
         
     except Exception as e:
-        print(f"❌ Transactions route error: {e}")
-        import traceback
-        print(f"❌ Traceback: {traceback.format_exc()}")
+        logger.exception("❌ Transactions route error: %s", e)
         return f"Transactions Error: {str(e)}", 500
 
 # 4) ROUTES (make sure the route comes AFTER the function so Python knows it)
@@ -1796,8 +2000,7 @@ def treasurer_setup():
     try:
         if request.method == 'GET':
             # Database mode - get config from SQLAlchemy models
-            from models import TreasurerConfig
-            print("🔍 Using database mode for treasurer setup")
+            logger.debug("🔍 Using database mode for treasurer setup")
             
             config = TreasurerConfig.query.first()
             if not config:
@@ -1810,7 +2013,6 @@ def treasurer_setup():
         
         elif request.method == 'POST':
             # POST - Update treasurer configuration
-            from models import TreasurerConfig
             config = TreasurerConfig.query.first()
             if not config:
                 config = TreasurerConfig()
@@ -1829,9 +2031,7 @@ def treasurer_setup():
         
     except Exception as e:
         db.session.rollback()
-        print(f"❌ Treasurer setup error: {e}")
-        import traceback
-        print(f"❌ Traceback: {traceback.format_exc()}")
+        logger.exception("❌ Treasurer setup error: %s", e)
         flash(f'Error in treasurer setup: {str(e)}', 'error')
         return redirect(url_for('dashboard'))
 
@@ -1844,8 +2044,6 @@ def handover_treasurer():
     
     try:
         # Clear treasurer-specific data
-        from models import TreasurerConfig, Semester
-        
         config = TreasurerConfig.query.first()
         if config:
             config.name = ""
@@ -1890,35 +2088,33 @@ def semester_management():
     try:
         if request.method == 'GET':
             # Database mode - get semesters from SQLAlchemy models
-            from models import Semester
-            print("🔍 Using database mode for semester management")
+            logger.debug("🔍 Using database mode for semester management")
             
-            db_semesters = Semester.query.all()
-            semesters = db_semesters
-            semesters.sort(key=lambda s: (s.year, ['Spring', 'Summer', 'Fall'].index(s.season)), reverse=True)
+            # Newest first: year, then season within the year
+            season_order = case(SEMESTER_SEASON_ORDER, value=Semester.season)
+            semesters = Semester.query.order_by(Semester.year.desc(), season_order.desc(), Semester.id).all()
             current_semester = Semester.query.filter_by(is_current=True).first()
             
-            print(f"🔍 Found {len(semesters)} semesters from database")
+            logger.debug("🔍 Found %s semesters from database", len(semesters))
             
             return render_template('semester_management.html', semesters=semesters, current_semester=current_semester)
         
         elif request.method == 'POST':
             # POST - Create new semester
-            from models import Semester
-            
             season = request.form.get('season')
             year = int(request.form.get('year'))
             
             # Archive current semester
+            now = datetime.now()
             current_sem = Semester.query.filter_by(is_current=True).first()
             if current_sem:
                 current_sem.is_current = False
-                current_sem.end_date = datetime.now().isoformat()
+                current_sem.end_date = now.isoformat()
             
             # Create new semester
             semester_id = f"{season.lower()}_{year}"
             new_semester = Semester(id=semester_id, name=f"{season} {year}", year=year, season=season, 
-                               start_date=datetime.now().isoformat(), end_date="", is_current=True)
+                               start_date=now.isoformat(), end_date="", is_current=True)
             
             db.session.add(new_semester)
             db.session.commit()
@@ -1927,9 +2123,7 @@ def semester_management():
             return redirect(url_for('semester_management'))
     except Exception as e:
         db.session.rollback()
-        print(f"❌ Semester management error: {e}")
-        import traceback
-        print(f"❌ Traceback: {traceback.format_exc()}")
+        logger.exception("❌ Semester management error: %s", e)
         flash(f'Error in semester management: {str(e)}', 'error')
         return redirect(url_for('semester_management'))
 
@@ -1946,8 +2140,8 @@ def preview_role(role_name):
         return redirect(url_for('dashboard'))
     
     # Valid roles for preview (updated to use generic 'chair' terminology)
-    valid_roles = ['president', 'vice_president', 'social_chair', 'phi_ed_chair', 'recruitment_chair', 'brotherhood_chair', 'brother']
-    if role_name not in valid_roles:
+    role_display = PREVIEW_ROLE_NAMES.get(role_name)
+    if role_display is None:
         flash('Invalid role for preview.', 'error')
         return redirect(url_for('dashboard'))
     
@@ -1956,11 +2150,6 @@ def preview_role(role_name):
     session['preview_role'] = role_name
     session['original_role'] = 'admin'
     
-    # Create user-friendly role name
-    role_display = role_name.replace('_', ' ').title()
-    if 'chair' in role_name.lower():
-        role_display = role_display.replace('Chair', 'Chair')  # Keep Chair capitalization
-    
     flash(f'Now previewing dashboard as: {role_display}. Click "Exit Preview" to return to admin view.', 'info')
     
     # Redirect based on role type
@@ -1987,9 +2176,7 @@ def exit_preview():
 @require_permission('send_reminders')
 def test_sms():
     """Test SMS functionality with comprehensive diagnostics"""
-    from models import TreasurerConfig
-    
-    config = TreasurerConfig.query.first()
+    config = get_treasurer_config()
     if not config or not config.phone:
         flash('Please configure your phone number in Treasurer Setup first.', 'error')
         return redirect(url_for('treasurer_setup'))
@@ -2000,10 +2187,10 @@ def test_sms():
     
     test_message = "Test SMS from Fraternity Treasurer App - SMS working correctly! 📱✅"
     
-    print(f"\n🧪 SMS TEST STARTING")
-    print(f"📱 Phone: {config.phone}")
-    print(f"📧 SMTP User: {config.smtp_username}")
-    print(f"💬 Message: {test_message}")
+    logger.info("🧪 SMS TEST STARTING")
+    logger.info("📱 Phone: %s", config.phone)
+    logger.info("📧 SMTP User: %s", config.smtp_username)
+    logger.info("💬 Message: %s", test_message)
     
     if send_email_to_sms(config.phone, test_message, config):
         flash(f'✅ Test SMS sent successfully to {config.phone}!', 'success')
@@ -2019,9 +2206,7 @@ def test_sms():
 @require_permission('send_reminders')
 def test_sms_to_number():
     """Test SMS to a specific phone number"""
-    from models import TreasurerConfig
-    
-    config = TreasurerConfig.query.first()
+    config = get_treasurer_config()
     test_phone = request.form.get('test_phone', '').strip()
     
     if not test_phone:
@@ -2034,9 +2219,9 @@ def test_sms_to_number():
     
     test_message = f"Test SMS from Fraternity Treasurer App to {test_phone} 📱✅"
     
-    print(f"\n🧪 SMS TEST TO CUSTOM NUMBER")
-    print(f"📱 Target Phone: {test_phone}")
-    print(f"📧 SMTP User: {config.smtp_username}")
+    logger.info("🧪 SMS TEST TO CUSTOM NUMBER")
+    logger.info("📱 Target Phone: %s", test_phone)
+    logger.info("📧 SMTP User: %s", config.smtp_username)
     
     if send_email_to_sms(test_phone, test_message, config):
         flash(f'✅ Test SMS sent successfully to {test_phone}!', 'success')
@@ -2065,7 +2250,7 @@ def submit_payment_plan():
 def submit_reimbursement():
     """Submit a reimbursement request (example route)"""
     submitter_name = request.form.get('submitter_name', session.get('user', 'Unknown'))
-    amount = float(request.form.get('amount', 0))
+    amount = parse_amount(request.form.get('amount', 0))
     category = request.form.get('category', '')
     description = request.form.get('description', '')
     
@@ -2081,9 +2266,7 @@ def submit_reimbursement():
 @require_permission('send_reminders')
 def test_approval_notification():
     """Test the approval notification system"""
-    from models import TreasurerConfig
-    
-    config = TreasurerConfig.query.first()
+    config = get_treasurer_config()
     if not config or (not config.phone and not config.email):
         flash('Please configure your phone and/or email in Treasurer Setup first.')
         return redirect(url_for('treasurer_setup'))
@@ -2103,10 +2286,9 @@ def notifications_dashboard():
     """Notifications dashboard for approval requests"""
     try:
         # Database mode - get config from SQLAlchemy models
-        from models import TreasurerConfig
-        print("🔍 Using database mode for notifications")
+        logger.debug("🔍 Using database mode for notifications")
         
-        config = TreasurerConfig.query.first()
+        config = get_treasurer_config()
         if config:
             email_configured = bool(config.smtp_username and config.smtp_password)
             treasurer_phone_configured = bool(config.phone)
@@ -2125,7 +2307,7 @@ def notifications_dashboard():
                 'treasurer_phone': ''
             }
         
-        print(f"🔍 Notification status: {notification_status}")
+        logger.debug("🔍 Notification status: %s", notification_status)
         
         # TODO: In the future, you could add pending approval requests here
         # For example:
@@ -2134,9 +2316,7 @@ def notifications_dashboard():
         return render_template('notifications_dashboard.html',
                          notification_status=notification_status)
     except Exception as e:
-        print(f"❌ Notifications dashboard error: {e}")
-        import traceback
-        print(f"❌ Traceback: {traceback.format_exc()}")
+        logger.exception("❌ Notifications dashboard error: %s", e)
         flash(f'Error loading notifications dashboard: {str(e)}', 'error')
         return redirect(url_for('dashboard'))
 
@@ -2157,7 +2337,8 @@ def brother_registration():
         return render_template('brother_registration.html')
     
     try:
-        from models import User, PendingBrother
+        # PendingBrother is not defined in models yet, so this stays a local import
+        from models import PendingBrother
         
         # Check if email already exists
         existing_user = User.query.filter_by(email=email).first()
@@ -2191,6 +2372,51 @@ def brother_registration():
         flash(f'Registration failed: {str(e)}', 'error')
         return render_template('brother_registration.html')
 
+# Stand-in member and payment data for admin role previews of the brother dashboard
+PREVIEW_PAYMENTS = (
+    {'amount': 250.0, 'date': '2024-09-01', 'method': 'Zelle', 'id': 'preview1'},
+)
+PREVIEW_PAYMENT_SCHEDULE = (
+    {'description': 'Full semester payment', 'due_date': '2024-09-01', 'amount': 500.0, 'status': 'paid'},
+)
+PREVIEW_PAYMENT_HISTORY = tuple(
+    {'amount': payment['amount'], 'date': payment['date'], 'method': payment['method']}
+    for payment in PREVIEW_PAYMENTS
+)
+PREVIEW_TOTAL_PAID = sum(payment['amount'] for payment in PREVIEW_PAYMENTS)
+
+@dataclass(frozen=True)
+class MockMember:
+    name: str
+    role: str
+    id: str = 'preview'
+    contact: str = 'preview@example.com'
+    dues_amount: float = 500.0
+    payment_plan: str = 'semester'
+    payments_made: tuple = PREVIEW_PAYMENTS
+    contact_type: str = 'email'
+
+@lru_cache(maxsize=16)
+def _preview_context(role_name):
+    """Mock dashboard context for previewing as role_name; it only depends on the role, so it's built once"""
+    context = {
+        'member': MockMember(name=f'Preview {role_name.replace("_", " ").title()}', role=role_name),
+        'balance': 250.0,  # Mock balance
+        'payment_schedule': PREVIEW_PAYMENT_SCHEDULE,
+        'payment_history': PREVIEW_PAYMENT_HISTORY,
+        'total_paid': PREVIEW_TOTAL_PAID,
+        'user_role': role_name,
+        'chapter_events': ()
+    }
+    if role_name in ['president', 'vice_president']:
+        context.update({
+            'dues_summary': {'total_collected': 5000.0, 'total_projected': 10000.0, 'outstanding': 5000.0, 'collection_rate': 50.0},  # Mock data
+            'budget_summary': {}  # Mock budget data
+        })
+    elif role_name in ['social_chair', 'phi_ed_chair', 'brotherhood_chair', 'recruitment_chair']:
+        context['budget_summary'] = {}
+    return MappingProxyType(context)
+
 @app.route('/brother_dashboard_preview/<role_name>')
 @require_auth
 def brother_dashboard_preview(role_name):
@@ -2199,70 +2425,10 @@ def brother_dashboard_preview(role_name):
     if (current_role != 'admin' and session.get('user') != 'admin') or not session.get('preview_mode'):
         return redirect(url_for('brother_dashboard'))
     
-    # Create a mock member for preview
-    from dataclasses import dataclass
-    
-    @dataclass
-    class MockMember:
-        id: str = 'preview'
-        name: str = f'Preview {role_name.replace("_", " ").title()}'
-        contact: str = 'preview@example.com'
-        dues_amount: float = 500.0
-        payment_plan: str = 'semester'
-        payments_made: list = None
-        contact_type: str = 'email'
-        role: str = role_name
-        
-        def __post_init__(self):
-            if self.payments_made is None:
-                self.payments_made = [
-                    {'amount': 250.0, 'date': '2024-09-01', 'method': 'Zelle', 'id': 'preview1'}
-                ]
-    
-    mock_member = MockMember()
-    balance = 250.0  # Mock balance
-    total_paid = sum(payment['amount'] for payment in mock_member.payments_made)
-    
-    # Mock payment schedule
-    payment_schedule = [
-        {'description': 'Full semester payment', 'due_date': '2024-09-01', 'amount': 500.0, 'status': 'paid'},
-    ]
-    payment_history = [
-        {
-            'amount': payment['amount'],
-            'date': payment['date'],
-            'method': payment['method']
-        }
-        for payment in mock_member.payments_made
-    ]
-    
-    # Get summary data based on permissions
-    data = {
-        'member': mock_member,
-        'balance': balance,
-        'payment_schedule': payment_schedule,
-        'payment_history': payment_history,
-        'total_paid': total_paid,
-        'user_role': role_name,
-        'chair_manual_links': CHAIR_MANUAL_LINKS,
-        'chair_role_to_category': CHAIR_ROLE_TO_CATEGORY,
-        'officer_roles': OFFICER_ROLES,
-        'chapter_events': []
-    }
-    
-    # Add additional data for executives (handle both database and JSON modes)
+    # The mock context is static per role; only the executives' member count is live
+    data = dict(_preview_context(role_name))
     if role_name in ['president', 'vice_president']:
-        # Database mode - get data from SQLAlchemy models
-        from models import Member as DBMember
-        total_members = DBMember.query.count()
-        data.update({
-            'total_members': total_members,
-            'dues_summary': {'total_collected': 5000.0, 'total_projected': 10000.0, 'outstanding': 5000.0, 'collection_rate': 50.0},  # Mock data
-            'budget_summary': {}  # Mock budget data
-        })
-    elif role_name in ['social_chair', 'phi_ed_chair', 'brotherhood_chair', 'recruitment_chair']:
-        # Database mode - mock budget data for preview
-        data.update({'budget_summary': {}})
+        data['total_members'] = db.session.query(func.count(Member.id)).scalar()
     return render_template('brother_dashboard.html', **data)
 
 @app.route('/brother_dashboard')
@@ -2275,9 +2441,16 @@ def brother_dashboard():
         flash('Member information not found. Please contact the treasurer.', 'error')
         return redirect(url_for('logout'))
     
-    # Get summary data using database
-    balance = member.get_balance() if hasattr(member, 'get_balance') else 0.0
-    payments = sorted(member.payments, key=lambda payment: payment.date, reverse=True)
+    # Get summary data using database - totals are summed in SQL
+    total_paid = db.session.query(func.coalesce(func.sum(Payment.amount), 0)).filter(Payment.member_id == member.id).scalar()
+    balance = member.dues_amount - total_paid
+    # The dashboard only lists the most recent payments
+    payments = (
+        Payment.query.filter_by(member_id=member.id)
+        .order_by(Payment.date.desc())
+        .limit(50)
+        .all()
+    )
     payment_history = [
         {
             'amount': payment.amount,
@@ -2286,13 +2459,12 @@ def brother_dashboard():
         }
         for payment in payments
     ]
-    total_paid = sum(payment.amount for payment in payments)
     payment_schedule = []  # TODO: Implement payment schedule for database mode
     
     current_semester = Semester.query.filter_by(is_current=True).first()
     chapter_events = []
     if current_semester:
-        chapter_events = Event.query.filter_by(semester_id=current_semester.id).order_by(Event.date.asc()).all()
+        chapter_events = get_chapter_events(current_semester.id)
     
     user_role = get_current_user_role()
     chair_category = CHAIR_ROLE_TO_CATEGORY.get(user_role)
@@ -2305,19 +2477,11 @@ def brother_dashboard():
         'payment_history': payment_history,
         'total_paid': total_paid,
         'user_role': user_role,
-        'chair_manual_links': CHAIR_MANUAL_LINKS,
-        'chair_role_to_category': CHAIR_ROLE_TO_CATEGORY,
-        'officer_roles': OFFICER_ROLES,
         'chapter_events': chapter_events
     }
     
     if current_semester and user_role in ['president', 'vice_president', 'admin', 'treasurer']:
-        total_members = Member.query.filter_by(semester_id=current_semester.id).count()
-        data.update({
-            'total_members': total_members,
-            'dues_summary': build_dues_summary(current_semester.id),
-            'budget_summary': build_budget_summary(current_semester.id)
-        })
+        data.update(build_dashboard_exec_summary(current_semester.id))
     elif current_semester and chair_category:
         data.update({
             'budget_summary': build_budget_summary(current_semester.id, categories=[chair_category])
@@ -2333,12 +2497,12 @@ def debug_pending_brothers():
     """Debug route to check pending brothers status"""
     from models import PendingBrother
     
-    print(f"\n🔍 DEBUGGING PENDING BROTHERS")
+    logger.debug("🔍 DEBUGGING PENDING BROTHERS")
     pending_brothers = PendingBrother.query.all()
-    print(f"   Current pending brothers count: {len(pending_brothers)}")
+    logger.debug("   Current pending brothers count: %s", len(pending_brothers))
     
     for pending_brother in pending_brothers:
-        print(f"   - {pending_brother.id}: {pending_brother.full_name} ({pending_brother.email})")
+        logger.debug("   - %s: %s (%s)", pending_brother.id, pending_brother.full_name, pending_brother.email)
     
     flash(f'Debug complete: {len(pending_brothers)} pending brothers found. Check console for details.')
     return redirect(url_for('verify_brothers'))
@@ -2348,37 +2512,49 @@ def debug_pending_brothers():
 @require_permission('manage_users')
 def credential_management():
     """Credential management page for treasurers to view all brother login details"""
-    from models import User
     
-    print(f"\n🔐 LOADING CREDENTIAL MANAGEMENT")
+    logger.debug("🔐 LOADING CREDENTIAL MANAGEMENT")
+    
+    total_users = db.session.query(func.count(User.id)).scalar()
+    
+    # Brother accounts with their linked member, in one joined query
+    brothers = (
+        db.session.query(User.id, User.phone, User.email, User.created_at,
+                         Member.id.label('member_id'), Member.name.label('member_name'))
+        .filter(User.roles.any(Role.name == 'brother'))
+        .outerjoin(Member, Member.user_id == User.id)
+        .order_by(User.id)
+        .all()
+    )
+    
+    # Active role names for those accounts, to pick each one's primary role
+    role_names_by_user = defaultdict(list)
+    if brothers:
+        for user_id, role_name in (
+            db.session.query(user_roles.c.user_id, Role.name)
+            .join(Role, Role.id == user_roles.c.role_id)
+            .filter(user_roles.c.user_id.in_([brother.id for brother in brothers]), user_roles.c.revoked_at.is_(None))
+        ):
+            role_names_by_user[user_id].append(role_name)
     
     credentials = []
-    brother_accounts = 0
-    linked_accounts = 0
-    
-    users = User.query.all()
-    total_users = len(users)
-    
-    for user in users:
-        is_brother = any(r.name == 'brother' for r in user.roles) or (user.get_primary_role() and user.get_primary_role().name == 'brother')
-        if is_brother:
-            brother_accounts += 1
-            member = getattr(user, 'member_record', None)
-            credentials.append({
-                'username': user.phone or user.email,
-                'password': '********** (Hashed - Not Recoverable)',
-                'role': user.get_primary_role().name if user.get_primary_role() else 'brother',
-                'created_at': getattr(user, 'created_at', 'Unknown'),
-                'member_name': getattr(member, 'full_name', getattr(member, 'name', None)) if member else None,
-                'member_id': getattr(member, 'id', None) if member else None,
-                'phone': user.phone
-            })
-            if member:
-                linked_accounts += 1
+    for brother in brothers:
+        role_names = role_names_by_user.get(brother.id)
+        credentials.append({
+            'username': brother.phone or brother.email,
+            'password': '********** (Hashed - Not Recoverable)',
+            'role': max(role_names, key=lambda name: ROLE_HIERARCHY.get(name, 0)) if role_names else 'brother',
+            'created_at': brother.created_at,
+            'member_name': brother.member_name,
+            'member_id': brother.member_id,
+            'phone': brother.phone
+        })
+    brother_accounts = len(credentials)
+    linked_accounts = sum(1 for brother in brothers if brother.member_id is not None)
     
-    print(f"   Total users: {total_users}")
-    print(f"   Brother accounts: {brother_accounts}")
-    print(f"   Linked accounts: {linked_accounts}")
+    logger.debug("   Total users: %s", total_users)
+    logger.debug("   Brother accounts: %s", brother_accounts)
+    logger.debug("   Linked accounts: %s", linked_accounts)
     
     return render_template('credential_management.html',
                          credentials=credentials,
@@ -2393,16 +2569,15 @@ def verify_brothers():
     """Treasurer interface to verify pending brother registrations"""
     try:
         # Database mode - handle pending user approvals
-        from models import User, Member as MemberModel, Role
-        print("🔍 Using database mode for brother verification")
+        logger.debug("🔍 Using database mode for brother verification")
         
         if request.method == 'GET':
             # Get pending users (status='pending')
             pending_users = User.query.filter_by(status='pending').all()
             # Get all members to link with
-            members = MemberModel.query.all()
+            members = Member.query.all()
             
-            print(f"👥 Found {len(pending_users)} pending users")
+            logger.debug("👥 Found %s pending users", len(pending_users))
             
             return render_template('verify_brothers_db.html',
                                  pending_users=pending_users,
@@ -2415,27 +2590,27 @@ def verify_brothers():
             action = request.form.get('action')
             
             if action == 'approve' and user_id:
-                user = User.query.get(user_id)
+                user = db.session.get(User, user_id)
                 if user:
                     user.status = 'active'
                     user.approved_at = datetime.utcnow()
                     
                     # Link to member if specified
                     if member_id:
-                        member = MemberModel.query.get(member_id)
+                        member = db.session.get(Member, member_id)
                         if member:
                             member.user_id = user.id
                     
-                    # Assign brother role
-                    brother_role = Role.query.filter_by(name='brother').first()
+                    # Assign brother role - an identity-map hit once the id is cached
+                    brother_role_id = get_role_ids().get('brother')
+                    brother_role = db.session.get(Role, brother_role_id) if brother_role_id else None
                     if brother_role and brother_role not in user.roles:
                         user.roles.append(brother_role)
                     
                     db.session.commit()
                     
                     # Send SMS credentials if configured
-                    from models import TreasurerConfig
-                    config = TreasurerConfig.query.first()
+                    config = get_treasurer_config()
                     if config and config.smtp_username and user.phone:
                         password_msg = f"Welcome to the fraternity app! Login: {user.phone} | Password: (same as registration)"
                         send_email_to_sms(user.phone, password_msg, config)
@@ -2445,7 +2620,7 @@ def verify_brothers():
                     flash('User not found!', 'error')
             
             elif action == 'reject' and user_id:
-                user = User.query.get(user_id)
+                user = db.session.get(User, user_id)
                 if user:
                     db.session.delete(user)
                     db.session.commit()
@@ -2457,50 +2632,92 @@ def verify_brothers():
         
     except Exception as e:
         db.session.rollback()
-        print(f"❌ Verify brothers error: {e}")
-        import traceback
-        print(f"❌ Traceback: {traceback.format_exc()}")
+        logger.exception("❌ Verify brothers error: %s", e)
         flash(f'Error in brother verification: {str(e)}', 'error')
         return redirect(url_for('dashboard'))
 
+def _role_rank(role_name):
+    """Sort key placing brother below every other role, then by ROLE_HIERARCHY"""
+    return -1 if role_name == 'brother' else ROLE_HIERARCHY.get(role_name, 0)
+
 @app.route('/role_management')
 @require_auth
 @require_permission('assign_roles')
 def role_management():
     """Role management interface for treasurers"""
-    from models import Member as MemberModel
     
-    db_members = MemberModel.query.all()
+    # The template only reads these columns plus each member's role, so skip building
+    # full ORM objects and outer-join the linked user's active role names instead
+    member_rows = (
+        db.session.query(Member.id, Member.name, Member.contact, Member.contact_type, Member.user_id, Role.name)
+        .outerjoin(user_roles, (user_roles.c.user_id == Member.user_id) & user_roles.c.revoked_at.is_(None))
+        .outerjoin(Role, Role.id == user_roles.c.role_id)
+        .order_by(Member.id)
+        .all()
+    )
     members = {}
-    for member in db_members:
-        members[str(member.id)] = member
-    
-    # Log current executive board for debugging
-    executive_roles = ['treasurer', 'president', 'vice_president', 'social_chair', 'phi_ed_chair', 'brotherhood_chair', 'recruitment_chair']
-    print(f"✅ Current Executive Board:")
-    
-    for exec_role in executive_roles:
-        assigned_members = []
-        for member_id, member in members.items():
-            member_role = getattr(member, 'role', 'brother')
-            member_name = getattr(member, 'full_name', getattr(member, 'name', 'Unknown'))
-            
-            if member_role == exec_role:
-                assigned_members.append(member_name)
-        
-        if assigned_members:
-            print(f"  {exec_role}: {', '.join(assigned_members)}")
-        else:
-            print(f"  {exec_role}: VACANT")
+    for member_id, name, contact, contact_type, user_id, role_name in member_rows:
+        member = members.get(str(member_id))
+        if member is None:
+            member = members[str(member_id)] = SimpleNamespace(
+                id=member_id, name=name, contact=contact, contact_type=contact_type, user_id=user_id, role=None
+            )
+        # Show the highest-ranked role the member's user holds; every assigned role comes
+        # with brother, and chair roles missing from ROLE_HIERARCHY must still win over it
+        if role_name and (member.role is None or _role_rank(role_name) > _role_rank(member.role)):
+            member.role = role_name
+    
+    # Log current executive board for debugging - roles live on the linked user,
+    # so pull (role, member name) pairs for the board in one joined query.
+    # Skipped entirely unless debug logging is on.
+    if logger.isEnabledFor(logging.DEBUG):
+        executive_roles = ['treasurer', 'president', 'vice_president', 'social_chair', 'phi_ed_chair', 'brotherhood_chair', 'recruitment_chair']
+        members_by_role = defaultdict(list)
+        for role_name, member_name in (
+            db.session.query(Role.name, Member.name)
+            .join(user_roles, user_roles.c.role_id == Role.id)
+            .join(Member, Member.user_id == user_roles.c.user_id)
+            .filter(Role.name.in_(executive_roles), user_roles.c.revoked_at.is_(None))
+        ):
+            members_by_role[role_name].append(member_name)
+        logger.debug("✅ Current Executive Board: %s", '; '.join(
+            f"{exec_role}: {', '.join(members_by_role.get(exec_role, ())) or 'VACANT'}" for exec_role in executive_roles
+        ))
     
     return render_template('role_management.html', members=members)
 
+def _set_user_role(user_id, role):
+    """Replace a user's roles (except admin) with role plus brother, without loading the association"""
+    role_names = [role, 'brother'] if role != 'brother' else ['brother']
+    
+    role_ids = get_role_ids()
+    
+    # Create any role rows that don't exist yet
+    missing = [Role(name=name, description=f'{name.replace("_", " ").title()} role') for name in role_names if name not in role_ids]
+    if missing:
+        db.session.add_all(missing)
+        db.session.flush()
+    
+    # Clear existing roles except admin, then grant the ones the user doesn't still hold
+    clear_roles = delete(user_roles).where(user_roles.c.user_id == user_id)
+    if 'admin' in role_ids:
+        clear_roles = clear_roles.where(user_roles.c.role_id != role_ids['admin'])
+    db.session.execute(clear_roles)
+    db.session.execute(
+        insert(user_roles).from_select(
+            ['user_id', 'role_id'],
+            select(literal(user_id), Role.id).where(
+                Role.name.in_(role_names),
+                ~exists().where(user_roles.c.user_id == user_id, user_roles.c.role_id == Role.id),
+            ),
+        )
+    )
+
 @app.route('/assign_role', methods=['POST'])
 @require_auth
 @require_permission('assign_roles')
 def assign_role():
     """Assign a role to a member"""
-    from models import Member as MemberModel, User, Role
     
     member_id = request.form.get('member_id')
     role = request.form.get('role')
@@ -2510,51 +2727,37 @@ def assign_role():
         return redirect(url_for('role_management'))
     
     try:
-        member = MemberModel.query.get(member_id)
+        member = db.session.get(Member, member_id)
         if not member:
             flash('Member not found.', 'error')
             return redirect(url_for('role_management'))
         
-        # Check if role is already taken
+        # Check if role is already taken - roles live on the member's user account,
+        # so look up another holder's id and name only
         if role != 'brother':
-            existing_member = MemberModel.query.filter_by(role=role).first()
-            if existing_member and str(existing_member.id) != member_id:
-                flash(f'{role.replace("_", " ").title()} position is already filled by {existing_member.full_name}.', 'warning')
+            existing_member = (
+                db.session.query(Member.id, Member.name)
+                .join(user_roles, user_roles.c.user_id == Member.user_id)
+                .join(Role, Role.id == user_roles.c.role_id)
+                .filter(Role.name == role, user_roles.c.revoked_at.is_(None), Member.id != member.id)
+                .first()
+            )
+            if existing_member:
+                flash(f'{role.replace("_", " ").title()} position is already filled by {existing_member.name}.', 'warning')
                 return redirect(url_for('role_management'))
         
-        # Update member role in database
-        member.role = role
-        
-        # Update user roles if user account exists
-        if member.user:
-            user = member.user
-            # Clear existing roles except admin
-            user.roles = [r for r in user.roles if r.name == 'admin']
-            
-            # Add new role
-            if role != 'brother':
-                role_obj = Role.query.filter_by(name=role).first()
-                if not role_obj:
-                    role_obj = Role(name=role, description=f'{role.replace("_", " ").title()} role')
-                    db.session.add(role_obj)
-                user.roles.append(role_obj)
-            
-            # Ensure brother role
-            brother_role = Role.query.filter_by(name='brother').first()
-            if not brother_role:
-                brother_role = Role(name='brother', description='Brother role')
-                db.session.add(brother_role)
-            if brother_role not in user.roles:
-                user.roles.append(brother_role)
+        # Roles live on the member's user account
+        if member.user_id:
+            _set_user_role(member.user_id, role)
         
         db.session.commit()
-        flash(f'{member.full_name} has been successfully assigned as {role.replace("_", " ").title()}.', 'success')
-        print(f"✅ Database role assignment: {member.full_name} -> {role}")
+        flash(f'{member.name} has been successfully assigned as {role.replace("_", " ").title()}.', 'success')
+        logger.info("✅ Database role assignment: %s -> %s", member.name, role)
         
     except Exception as e:
         db.session.rollback()
         flash(f'Error assigning role: {e}', 'error')
-        print(f"❌ Database role assignment failed: {e}")
+        logger.exception("❌ Database role assignment failed: %s", e)
     
     return redirect(url_for('role_management'))
 
@@ -2576,45 +2779,53 @@ def ai_assistant():
     
     return jsonify({'response': response})
 
-def get_ai_response(message):
-    """Simple rule-based AI assistant responses"""
-    
+# Assistant keywords by topic, matched against the lowercased message in one regex scan
+_AI_KEYWORDS = {
+    'trouble': ('not working', 'broken', 'error'),
+    'email': ('email',),
+    'send_failure': ('not send', 'fail'),
+    'sms': ('sms', 'text'),
+    'setup': ('setup', 'configure', 'install'),
+    'members': ('how to', 'add member'),
+    'payments': ('payment', 'dues'),
+    'budget': ('budget', 'expense'),
+    'export': ('export', 'backup'),
+    'semester': ('semester', 'new year'),
+    'help': ('help', 'what can you do'),
+}
+# Zero-width lookahead so overlapping keywords are all reported
+_AI_KEYWORD_RE = re.compile('(?=(?:%s))' % '|'.join(
+    f"(?P<{topic}>{'|'.join(map(re.escape, words))})" for topic, words in _AI_KEYWORDS.items()
+))
+
+# (topics that must all appear, response) in priority order
+_AI_RESPONSES = (
     # Troubleshooting responses
-    if 'not working' in message or 'broken' in message or 'error' in message:
-        return "🔧 **Troubleshooting Steps:**\n1. Try refreshing the page\n2. Check if all required fields are filled\n3. Restart the app using 'Start Treasurer App.command'\n4. Check the terminal for error messages\n\nWhat specific issue are you experiencing?"
-    
-    if 'email' in message and ('not send' in message or 'fail' in message):
-        return "📧 **Email Issues:**\n1. Go to Treasurer Setup → Email Configuration\n2. Verify Gmail username is correct\n3. Use Gmail **App Password**, not regular password\n4. Test with your own email first\n\n**Get App Password:** Google Account → Security → 2-Step Verification → App passwords"
-    
-    if 'sms' in message or 'text' in message:
-        return "📱 **SMS Issues:**\n1. SMS uses free email-to-SMS gateways\n2. Works with all major carriers: Verizon, AT&T, T-Mobile\n3. Use format: +1234567890 (include +1)\n4. Test via Notifications → 'Test SMS to Treasurer'\n\n**Tip:** SMS delivery may take 1-2 minutes"
-    
+    (frozenset({'trouble'}), "🔧 **Troubleshooting Steps:**\n1. Try refreshing the page\n2. Check if all required fields are filled\n3. Restart the app using 'Start Treasurer App.command'\n4. Check the terminal for error messages\n\nWhat specific issue are you experiencing?"),
+    (frozenset({'email', 'send_failure'}), "📧 **Email Issues:**\n1. Go to Treasurer Setup → Email Configuration\n2. Verify Gmail username is correct\n3. Use Gmail **App Password**, not regular password\n4. Test with your own email first\n\n**Get App Password:** Google Account → Security → 2-Step Verification → App passwords"),
+    (frozenset({'sms'}), "📱 **SMS Issues:**\n1. SMS uses free email-to-SMS gateways\n2. Works with all major carriers: Verizon, AT&T, T-Mobile\n3. Use format: +1234567890 (include +1)\n4. Test via Notifications → 'Test SMS to Treasurer'\n\n**Tip:** SMS delivery may take 1-2 minutes"),
     # Setup help
-    if 'setup' in message or 'configure' in message or 'install' in message:
-        return "⚙️ **Setup Guide:**\n1. **New Treasurer:** Login → Treasurer Setup → Configure credentials\n2. **Email:** Get Gmail App Password → Enter in Email Config\n3. **Phone:** Add your phone for SMS notifications\n4. **Test:** Use 'Test SMS to Treasurer' to verify setup\n\nNeed help with specific setup?"
-    
+    (frozenset({'setup'}), "⚙️ **Setup Guide:**\n1. **New Treasurer:** Login → Treasurer Setup → Configure credentials\n2. **Email:** Get Gmail App Password → Enter in Email Config\n3. **Phone:** Add your phone for SMS notifications\n4. **Test:** Use 'Test SMS to Treasurer' to verify setup\n\nNeed help with specific setup?"),
     # Feature help
-    if 'how to' in message or 'add member' in message:
-        return "👥 **Member Management:**\n• **Add Single:** Dashboard → Member Management → Fill form\n• **Bulk Import:** Dashboard → 'Bulk Import' → Paste member list\n• **Payment:** Find member → 'Record Payment'\n• **Edit:** Click member name → Edit details\n\n**Tip:** Use bulk import for large member lists!"
-    
-    if 'payment' in message or 'dues' in message:
-        return "💰 **Payment & Dues:**\n• **Record Payment:** Dashboard → Find member → Record Payment\n• **Send Reminders:** Selective Reminders → Choose members\n• **View Status:** Click member name for details\n• **Payment Plans:** Edit member → Choose plan (semester/monthly)\n\n**Custom Schedules:** Member Details → Custom Payment Schedule"
-    
-    if 'budget' in message or 'expense' in message:
-        return "📊 **Budget & Expenses:**\n• **Set Budget:** Budget Management → Set limits per category\n• **Add Expense:** Dashboard → Add Transaction → Select 'Expense'\n• **Track Spending:** Budget Management shows % used\n• **Categories:** Executive, Social, Philanthropy, etc.\n\n**Monthly Reports:** Monthly Income page"
-    
-    if 'export' in message or 'backup' in message:
-        return "📄 **Data Export & Backup:**\n• **CSV Export:** Export data to CSV files\n• **Manual Backup:** Copy entire app folder\n• **Handover:** All data preserved automatically\n• **Local Storage:** All data stored securely locally\n\n**Tip:** Regular backups ensure data safety!"
-    
-    if 'semester' in message or 'new year' in message:
-        return "📅 **Semester Management:**\n• **New Semester:** Semesters → Create New Semester\n• **Auto-Archive:** Previous semester archived automatically\n• **View History:** All semesters page shows past terms\n• **Data:** All member/transaction data preserved\n\n**Best Practice:** Export data before creating new semester"
-    
+    (frozenset({'members'}), "👥 **Member Management:**\n• **Add Single:** Dashboard → Member Management → Fill form\n• **Bulk Import:** Dashboard → 'Bulk Import' → Paste member list\n• **Payment:** Find member → 'Record Payment'\n• **Edit:** Click member name → Edit details\n\n**Tip:** Use bulk import for large member lists!"),
+    (frozenset({'payments'}), "💰 **Payment & Dues:**\n• **Record Payment:** Dashboard → Find member → Record Payment\n• **Send Reminders:** Selective Reminders → Choose members\n• **View Status:** Click member name for details\n• **Payment Plans:** Edit member → Choose plan (semester/monthly)\n\n**Custom Schedules:** Member Details → Custom Payment Schedule"),
+    (frozenset({'budget'}), "📊 **Budget & Expenses:**\n• **Set Budget:** Budget Management → Set limits per category\n• **Add Expense:** Dashboard → Add Transaction → Select 'Expense'\n• **Track Spending:** Budget Management shows % used\n• **Categories:** Executive, Social, Philanthropy, etc.\n\n**Monthly Reports:** Monthly Income page"),
+    (frozenset({'export'}), "📄 **Data Export & Backup:**\n• **CSV Export:** Export data to CSV files\n• **Manual Backup:** Copy entire app folder\n• **Handover:** All data preserved automatically\n• **Local Storage:** All data stored securely locally\n\n**Tip:** Regular backups ensure data safety!"),
+    (frozenset({'semester'}), "📅 **Semester Management:**\n• **New Semester:** Semesters → Create New Semester\n• **Auto-Archive:** Previous semester archived automatically\n• **View History:** All semesters page shows past terms\n• **Data:** All member/transaction data preserved\n\n**Best Practice:** Export data before creating new semester"),
     # General help
-    if 'help' in message or 'what can you do' in message:
-        return "🤖 **I can help with:**\n• Troubleshooting issues\n• Setup and configuration\n• Member management\n• Payment processing\n• Budget tracking\n• Data export\n• Semester transitions\n\n**Ask me:** 'How to add members?' or 'Email not working?'"
+    (frozenset({'help'}), "🤖 **I can help with:**\n• Troubleshooting issues\n• Setup and configuration\n• Member management\n• Payment processing\n• Budget tracking\n• Data export\n• Semester transitions\n\n**Ask me:** 'How to add members?' or 'Email not working?'"),
+)
+_AI_DEFAULT_RESPONSE = "💡 **Common Questions:**\n• 'Email not working' - Email troubleshooting\n• 'How to add members' - Member management help\n• 'Setup help' - Configuration guidance\n• 'SMS issues' - Text message problems\n• 'Export data' - Backup and export help\n\n**Tip:** Be specific about your issue for better help!"
+
+def get_ai_response(message):
+    """Simple rule-based AI assistant responses"""
+    topics = {match.lastgroup for match in _AI_KEYWORD_RE.finditer(message)}
+    for required_topics, response in _AI_RESPONSES:
+        if required_topics <= topics:
+            return response
     
     # Default response
-    return "💡 **Common Questions:**\n• 'Email not working' - Email troubleshooting\n• 'How to add members' - Member management help\n• 'Setup help' - Configuration guidance\n• 'SMS issues' - Text message problems\n• 'Export data' - Backup and export help\n\n**Tip:** Be specific about your issue for better help!"
+    return _AI_DEFAULT_RESPONSE
 
 # Fallback chair dashboard route when blueprint fails
 @app.route('/chair')
@@ -2625,12 +2836,12 @@ def chair_dashboard_fallback():
     current_user_role = get_current_user_role()
     
     # Check if user is a chair
-    if not current_user_role.endswith('_chair'):
+    chair_type = CHAIR_TYPE_BY_ROLE.get(current_user_role)
+    if chair_type is None:
         flash('Access denied. You must be a chair to access this page.', 'error')
         return redirect(url_for('dashboard'))
     
     # Mock data for now since chair blueprint might not be working
-    chair_type = current_user_role.replace('_chair', '')
     
     mock_data = {
         'primary_category': chair_type.title(),
@@ -2650,26 +2861,16 @@ def chair_budget_management():
     """Chair budget management page with tab navigation"""
     current_user_role = get_current_user_role()
     
-    # Define chair categories
-    chair_categories = {
-        'social': 'Social Chair',
-        'phi_ed': 'Phi Ed Chair', 
-        'brotherhood': 'Brotherhood Chair',
-        'recruitment': 'Recruitment Chair'
-    }
-    
     # Check user permissions
     can_view_all_budgets = has_permission('manage_budgets') or current_user_role in ['admin', 'treasurer', 'president', 'vice_president']
     
     # Determine user's chair type if they're a chair
-    user_chair_type = None
-    if current_user_role.endswith('_chair'):
-        user_chair_type = current_user_role.replace('_chair', '')
+    user_chair_type = CHAIR_TYPE_BY_ROLE.get(current_user_role)
     
     # Build chair budget data
     chair_budgets = {}
     
-    for chair_type, display_name in chair_categories.items():
+    for chair_type, display_name in CHAIR_BUDGET_TABS.items():
         # Determine if user can access this chair's budget
         accessible = can_view_all_budgets or (user_chair_type == chair_type)
         
@@ -2698,34 +2899,21 @@ def chair_budget_management():
 
 def get_chair_budget_data_db(chair_type):
     """Get chair budget data from database"""
-    from models import BudgetLimit, Transaction
-    
-    # Map chair types to budget categories
-    category_mapping = {
-        'social': 'Social',
-        'phi_ed': 'Phi ED',
-        'brotherhood': 'Brotherhood',
-        'recruitment': 'Recruitment'
-    }
-    
-    category = category_mapping.get(chair_type, chair_type.title())
+    category = CHAIR_TYPE_TO_CATEGORY.get(chair_type, chair_type.title())
     
     # Get budget limit from database
     budget_limit_record = BudgetLimit.query.filter_by(category=category).first()
     budget_limit = budget_limit_record.amount if budget_limit_record else 0.0
     
-    # Get all expenses for this category from database
-    expense_transactions = Transaction.query.filter_by(
-        type='expense',
-        category=category
-    ).order_by(Transaction.date.desc()).all()
-    
-    # Calculate total spent
-    total_spent = sum(t.amount for t in expense_transactions)
+    # Total spent and expense count for this category, summed in SQL
+    expenses = Transaction.query.filter_by(type='expense', category=category)
+    total_spent, expenses_count = expenses.with_entities(
+        func.coalesce(func.sum(Transaction.amount), 0), func.count(Transaction.id)
+    ).one()
     
     # Format recent expenses for display
     recent_expenses = []
-    for trans in expense_transactions[:10]:  # Get last 10
+    for trans in expenses.order_by(Transaction.date.desc()).limit(10):  # Get last 10
         recent_expenses.append({
             'date': trans.date.strftime('%Y-%m-%d'),
             'description': trans.description,
@@ -2735,17 +2923,13 @@ def get_chair_budget_data_db(chair_type):
             'notes': getattr(trans, 'notes', '')
         })
     
-    # Calculate remaining and usage
-    remaining = budget_limit - total_spent
-    usage_percentage = (total_spent / budget_limit * 100) if budget_limit > 0 else 0
-    
     return {
         'budget_limit': budget_limit,
         'total_spent': total_spent,
         'pending_amount': 0.0,  # TODO: Get from pending reimbursements if needed
-        'remaining': remaining,
-        'usage_percentage': min(usage_percentage, 100),
-        'expenses_count': len(expense_transactions),
+        'remaining': budget_limit - total_spent,
+        'usage_percentage': min(100.0, total_spent / budget_limit * 100) if budget_limit > 0 else 0,
+        'expenses_count': expenses_count,
         'spending_plans': [],  # TODO: Get from spending plans table if needed
         'pending_reimbursements': [],  # TODO: Get from reimbursement requests if needed
         'recent_expenses': recent_expenses
@@ -2759,7 +2943,7 @@ def get_chair_budget_data_db(chair_type):
 def export_chair_budget(chair_type):
     """Export chair budget data as CSV"""
     current_user_role = get_current_user_role()
-    user_chair_type = current_user_role.replace('_chair', '') if current_user_role.endswith('_chair') else None
+    user_chair_type = CHAIR_TYPE_BY_ROLE.get(current_user_role)
     
     # Check permissions
     can_view_all = has_permission('manage_budgets') or current_user_role in ['admin', 'treasurer', 'president', 'vice_president']
@@ -2768,31 +2952,35 @@ def export_chair_budget(chair_type):
         return redirect(url_for('chair_budget_management'))
     
     # Get chair budget data
-        budget_data = get_chair_budget_data_db(chair_type)
-    # Create CSV content
-    import io
-    import csv
-    from flask import Response
-    
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Write budget overview
-    writer.writerow([f'{chair_type.title()} Chair Budget Export'])
-    writer.writerow(['Budget Allocation', f"${budget_data['budget_limit']:.2f}"])
-    writer.writerow(['Total Spent', f"${budget_data['total_spent']:.2f}"])
-    writer.writerow(['Remaining', f"${budget_data['remaining']:.2f}"])
-    writer.writerow([])
-    
-    # Write expenses
-    writer.writerow(['Recent Expenses'])
-    writer.writerow(['Date', 'Description', 'Amount', 'Status'])
-    for expense in budget_data['recent_expenses']:
-        writer.writerow([expense['date'], expense['description'], f"${expense['amount']:.2f}", expense['status']])
-    
-    output.seek(0)
+    budget_data = get_chair_budget_data_db(chair_type)
+    
+    def generate():
+        # Stream the CSV line by line through one small reusable buffer
+        output = io.StringIO()
+        writer = csv.writer(output)
+        
+        def emit(row):
+            writer.writerow(row)
+            line = output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+            return line
+        
+        # Budget overview
+        yield emit([f'{chair_type.title()} Chair Budget Export'])
+        yield emit(['Budget Allocation', f"${budget_data['budget_limit']:.2f}"])
+        yield emit(['Total Spent', f"${budget_data['total_spent']:.2f}"])
+        yield emit(['Remaining', f"${budget_data['remaining']:.2f}"])
+        yield emit([])
+        
+        # Expenses
+        yield emit(['Recent Expenses'])
+        yield emit(['Date', 'Description', 'Amount', 'Status'])
+        for expense in budget_data['recent_expenses']:
+            yield emit([expense['date'], expense['description'], f"${expense['amount']:.2f}", expense['status']])
+    
     return Response(
-        output.getvalue(),
+        stream_with_context(generate()),
         mimetype='text/csv',
         headers={'Content-Disposition': f'attachment; filename={chair_type}_budget_export.csv'}
     )
@@ -2814,7 +3002,7 @@ def debug_db_status():
 def debug_init_db():
     """Manually initialize database with default data"""
     try:
-        init_database(app)
+        init_database(app, force=True)
         return {'success': True, 'message': 'Database initialized successfully'}
     except Exception as e:
         return {'error': str(e)}
@@ -2823,10 +3011,8 @@ def debug_init_db():
 def debug_payment_status():
     """Debug payment data specifically"""
     try:
-        from models import User, Role, Member, Transaction, Payment
-        
-        # Get sample members with their payments
-        members = Member.query.limit(10).all()
+        # Get sample members with their payments (batched into one IN query)
+        members = Member.query.options(selectinload(Member.payments)).limit(10).all()
         member_data = []
         
         for member in members:
@@ -2857,8 +3043,6 @@ def debug_payment_status():
 def debug_data_status():
     """Check what data exists in the database"""
     try:
-        from models import User, Role, Member, Transaction, Payment, BudgetLimit, Semester
-        
         data_status = {
         'users': User.query.count(),
         'roles': Role.query.count(), 
@@ -2887,8 +3071,6 @@ def debug_data_status():
 def debug_fix_roles():
     """Check and create missing default roles"""
     try:
-        from models import Role, init_default_roles
-        
         # Check current roles
         existing_roles = [r.name for r in Role.query.all()]
         
@@ -2911,23 +3093,20 @@ def debug_fix_roles():
 def debug_fix_admin_role():
     """Manually fix admin role assignment"""
     try:
-        from models import User, Role
-        
-        # Get admin user and admin role
+        # Get admin user - its roles load with it
         admin_user = User.query.filter_by(phone='admin').first()
-        admin_role = Role.query.filter_by(name='admin').first()
-        
         if not admin_user:
             return {'error': 'Admin user not found'}
         
-        if not admin_role:
-            return {'error': 'Admin role not found - try /debug/fix_roles first'}
-        
         # Check current roles
         current_roles = [r.name for r in admin_user.roles]
         
         if 'admin' not in current_roles:
-            admin_user.roles.append(admin_role)
+            # Only now look up the admin role, through the cached role ids
+            admin_role_id = get_role_ids().get('admin')
+            if not admin_role_id:
+                return {'error': 'Admin role not found - try /debug/fix_roles first'}
+            admin_user.roles.append(db.session.get(Role, admin_role_id))
             db.session.commit()
             return {'success': True, 'message': f'Admin role added. User now has roles: {[r.name for r in admin_user.roles]}'}
         else:
@@ -2957,14 +3136,12 @@ if __name__ == '__main__':
 # Add error handlers to show detailed errors in production
 @app.errorhandler(500)
 def internal_error(error):
-    import traceback
     error_details = traceback.format_exc()
     print(f"❌ 500 Error: {error_details}")
     return f"<h1>Internal Server Error</h1><pre>{error_details}</pre>", 500
 
 @app.errorhandler(Exception)
 def handle_exception(e):
-    import traceback
     error_details = traceback.format_exc()
     print(f"❌ Unhandled Exception: {error_details}")
     return f"<h1>Application Error</h1><pre>{error_details}</pre>", 500
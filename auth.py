@@ -21,7 +21,7 @@ login_manager.login_message_category = 'info'
 @login_manager.user_loader
 def load_user(user_id):
     """Load user by ID for Flask-Login"""
-    return User.query.get(int(user_id))
+    return db.session.get(User, int(user_id))
 
 def init_auth(app):
     """Initialize authentication system with Flask app"""
@@ -286,7 +286,7 @@ def admin_users():
 @role_required('treasurer')
 def approve_user(user_id):
     """Approve a pending user"""
-    user = User.query.get_or_404(user_id)
+    user = db.get_or_404(User, user_id)
     
     if user.status != 'pending':
         flash('User is not pending approval.', 'error')
@@ -312,7 +312,7 @@ def approve_user(user_id):
 @role_required('treasurer')
 def link_member(user_id):
     """Link user account to existing member record"""
-    user = User.query.get_or_404(user_id)
+    user = db.get_or_404(User, user_id)
     member_id = request.form.get('member_id')
     
     if not member_id:
@@ -320,7 +320,7 @@ def link_member(user_id):
         return redirect(url_for('auth.admin_users'))
     
     try:
-        member = Member.query.get(member_id)
+        member = db.session.get(Member, member_id)
         if not member:
             flash('Member not found.', 'error')
             return redirect(url_for('auth.admin_users'))
@@ -349,7 +349,7 @@ def link_member(user_id):
 @role_required('treasurer')
 def suspend_user(user_id):
     """Suspend a user account"""
-    user = User.query.get_or_404(user_id)
+    user = db.get_or_404(User, user_id)
     
     # Prevent suspending treasurer accounts
     if user.has_role('treasurer'):
@@ -370,7 +370,7 @@ def suspend_user(user_id):
 @role_required('treasurer')
 def manage_user_roles(user_id):
     """Manage user roles"""
-    user = User.query.get_or_404(user_id)
+    user = db.get_or_404(User, user_id)
     all_roles = Role.query.all()
     
     if request.method == 'POST':
@@ -387,7 +387,7 @@ def manage_user_roles(user_id):
             
             # Add selected roles
             for role_id in selected_role_ids:
-                role = Role.query.get(role_id)
+                role = db.session.get(Role, role_id)
                 if role and role not in user.roles:
                     user.roles.append(role)
             
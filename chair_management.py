@@ -144,7 +144,7 @@ def create_event():
 @permission_required('edit_own_events')
 def edit_event(event_id):
     """Edit an existing event"""
-    event = Event.query.get_or_404(event_id)
+    event = db.get_or_404(Event, event_id)
     
     # Check if user can edit this event
     if event.created_by != current_user.id:
@@ -234,7 +234,7 @@ def create_spending_plan():
         selected_event_ids = request.form.getlist('events')
         
         for event_id in selected_event_ids:
-            event = Event.query.get(int(event_id))
+            event = db.session.get(Event, int(event_id))
             if event and event.created_by == current_user.id:
                 allocated_amount = float(request.form.get(f'amount_{event_id}', 0))
                 plan_items.append({
@@ -300,7 +300,7 @@ def create_spending_plan():
 @permission_required('view_own_spending_plans')
 def view_spending_plan(plan_id):
     """View a spending plan in detail"""
-    spending_plan = SpendingPlan.query.get_or_404(plan_id)
+    spending_plan = db.get_or_404(SpendingPlan, plan_id)
     
     # Check if user can view this plan
     if spending_plan.created_by != current_user.id and not has_permission('view_chair_spending_plans'):
@@ -319,7 +319,7 @@ def view_spending_plan(plan_id):
 @permission_required('edit_own_events')
 def update_event_status(event_id):
     """API endpoint to update event status"""
-    event = Event.query.get_or_404(event_id)
+    event = db.get_or_404(Event, event_id)
     
     if event.created_by != current_user.id:
         return jsonify({'error': 'Permission denied'}), 403
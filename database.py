@@ -2,8 +2,42 @@
 Database configuration and utilities
 """
 import os
+from functools import lru_cache
 from flask import Flask
-from models import db, init_default_roles, Committee, User, Role, Member, Transaction, Semester
+from sqlalchemy import inspect, text
+from sqlalchemy.dialects import postgresql, sqlite
+from werkzeug.security import generate_password_hash
+from flask.json.provider import DefaultJSONProvider
+from jinja2 import FileSystemBytecodeCache
+
+try:
+    from celery import Celery
+except ImportError:  # Celery is optional - SMS is sent inline without it
+    Celery = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - jsonify falls back to the json module
+    orjson = None
+
+from models import db, init_default_roles, user_roles, Committee, User, Role, Member, Transaction, Semester, SystemMeta, RETIRED_INDEXES
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with orjson, keeping sorted keys"""
+    # Dates still go through Flask's default() so they keep the HTTP date format
+    option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME if orjson else 0
+    
+    def dumps(self, obj, **kwargs):
+        # Pretty-printed debug responses ask for an indent; leave those to the json module
+        if kwargs.get('indent'):
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+    
+    def loads(self, s, **kwargs):
+        # Hooks such as the session serializer's object_hook need the json module
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
 
 def create_app(config_mode='development'):
     """Create and configure Flask app"""
@@ -18,6 +52,14 @@ def create_app(config_mode='development'):
             if database_url.startswith('postgres://'):
                 database_url = database_url.replace('postgres://', 'postgresql://', 1)
             app.config['SQLALCHEMY_DATABASE_URI'] = database_url
+            # Keep warm connections for concurrent workers; pre-ping and recycle
+            # drop connections the hosted database has closed while idle
+            app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+                'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+                'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 10)),
+                'pool_pre_ping': True,
+                'pool_recycle': 280,
+            }
             print(f"🔗 Using PostgreSQL: {database_url[:50]}...")
         else:
             app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///fraternity.db'
@@ -30,64 +72,143 @@ def create_app(config_mode='development'):
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
     app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'change-me-in-production')
     
+    # Templates: reuse compiled bytecode across restarts and skip mtime checks in production
+    if config_mode == 'production':
+        app.config['TEMPLATES_AUTO_RELOAD'] = False
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(os.environ.get('JINJA_CACHE_DIR'))
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+    
     # Initialize database
     db.init_app(app)
     
+    # Background task queue for outbound SMS (optional)
+    broker_url = os.environ.get('CELERY_BROKER_URL')
+    if broker_url and Celery is not None:
+        celery = Celery(app.import_name, broker=broker_url)
+        celery.conf.update(task_ignore_result=True)
+        app.extensions['celery'] = celery
+        print(f"📬 Using Celery broker: {broker_url.split('@')[-1]}")
+    
     return app
 
-def init_database(app):
-    """Initialize database tables and default data"""
+# Dialect INSERT constructs that support ON CONFLICT DO NOTHING
+_CONFLICT_AWARE_INSERTS = {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}
+
+def _insert_or_ignore(table):
+    """INSERT that skips rows hitting a unique constraint, so concurrent worker starts can seed safely"""
+    dialect_insert = _CONFLICT_AWARE_INSERTS.get(db.session.get_bind().dialect.name)
+    if dialect_insert is None:
+        return db.insert(table)
+    return dialect_insert(table).on_conflict_do_nothing()
+
+def _seed_user(password, **columns):
+    """Insert a seed user unless it already exists (or another worker just created it); returns its new id or None"""
+    return db.session.execute(
+        _insert_or_ignore(User).values(password_hash=generate_password_hash(password), **columns).returning(User.id)
+    ).scalar()
+
+@lru_cache(maxsize=None)
+def _get_app(config_mode='development'):
+    """App for the command-line helpers, created once per config mode and reused"""
+    return create_app(config_mode)
+
+def sync_indexes():
+    """Create declared indexes missing from existing tables and drop retired ones
+    
+    create_all() leaves existing tables alone, so indexes declared after a table was
+    created only arrive here. Runs from init rather than on every worker start so the
+    DDL and its write locks happen once per deploy.
+    """
+    inspector = inspect(db.engine)
+    existing_tables = set(inspector.get_table_names())
+    for table in db.metadata.sorted_tables:
+        if table.name not in existing_tables or not (table.indexes or table.name in RETIRED_INDEXES):
+            continue
+        # One reflection per table rather than a checkfirst probe per index
+        existing_indexes = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing_indexes:
+                print(f"🔄 Creating missing index: {index.name}")
+                index.create(db.engine, checkfirst=True)
+        # Drop indexes a newer declaration has superseded so they don't slow every write
+        for index_name in RETIRED_INDEXES.get(table.name, ()):
+            if index_name in existing_indexes:
+                print(f"🔄 Dropping retired index: {index_name}")
+                with db.engine.begin() as conn:
+                    conn.execute(text(f'DROP INDEX IF EXISTS {index_name}'))
+
+def init_database(app, force=False):
+    """Initialize database tables and default data
+    
+    Indexes are always synced; seeding is skipped once a previous run has
+    finished it, unless ``force`` is set.
+    """
     with app.app_context():
+        sync_indexes()
+        
+        if not force and inspect(db.engine).has_table(SystemMeta.__tablename__) \
+                and db.session.get(SystemMeta, 'bootstrapped') is not None:
+            print("✅ Database already bootstrapped - skipping default data")
+            return
+        
         # Create all tables
         db.create_all()
         
-        # Initialize default roles
+        # Initialize default roles, then load the (small) table once for the lookups below
         init_default_roles()
+        roles_by_name = {role.name: role for role in Role.query.all()}
 
-        # Initialize default committees
-        for committee_name in ["Brotherhood", "Social", "Recruitment"]:
-            if not Committee.query.filter_by(name=committee_name).first():
-                db.session.add(Committee(name=committee_name, is_active=True))
+        # Initialize default committees - one multi-row INSERT, existing names are skipped
+        db.session.execute(
+            _insert_or_ignore(Committee.__table__),
+            [{'name': committee_name, 'is_active': True} for committee_name in ("Brotherhood", "Social", "Recruitment")]
+        )
         db.session.commit()
         
-        # Check if there's an admin user
-        from models import User, Role
-        # Check if admin user exists (with or without roles)
+        # Check if admin user exists (with or without roles), and whether it holds
+        # the admin role - an EXISTS probe on its user_roles rows
         admin_user = User.query.filter_by(phone='admin').first()
-        admin_with_role = User.query.join(User.roles).filter(Role.name == 'admin').first()
+        admin_with_role = admin_user is not None and db.session.query(
+            db.exists()
+            .where(user_roles.c.user_id == admin_user.id)
+            .where(user_roles.c.role_id == Role.id)
+            .where(Role.name == 'admin')
+        ).scalar()
         
         if not admin_user:
             # Create admin user if it doesn't exist at all
             print("Creating admin account for system management...")
             
-            admin_user = User(
+            admin_user_id = _seed_user(
+                "admin123",  # Keep familiar admin password
                 phone="admin",  # Special admin identifier
                 first_name="System",
                 last_name="Admin",
                 email="admin@example.com",
                 status="active"
             )
-            admin_user.set_password("admin123")  # Keep familiar admin password
-            
-            # Assign admin role (permanent system access)
-            admin_role = Role.query.filter_by(name='admin').first()
-            if admin_role:
-                admin_user.roles.append(admin_role)
-                print("✅ Assigned admin role to new admin user")
+            if admin_user_id is None:
+                print("✅ Admin account was created by another worker")
             else:
-                print("❌ Admin role not found in database")
-            
-            db.session.add(admin_user)
+                # Assign admin role (permanent system access)
+                admin_role = roles_by_name.get('admin')
+                if admin_role:
+                    db.session.execute(user_roles.insert(), {'user_id': admin_user_id, 'role_id': admin_role.id})
+                    print("✅ Assigned admin role to new admin user")
+                else:
+                    print("❌ Admin role not found in database")
+                
+                print("✅ Created admin account")
+                print("📱 Username: admin")
+                print("🔒 Password: admin123")
+                print("💡 Admin account has full system access")
             db.session.commit()
-            print("✅ Created admin account")
-            print("📱 Username: admin")
-            print("🔒 Password: admin123")
-            print("💡 Admin account has full system access")
             
         elif not admin_with_role:
             # Admin user exists but has no admin role assigned
             print("Admin user exists but has no admin role - fixing...")
-            admin_role = Role.query.filter_by(name='admin').first()
+            admin_role = roles_by_name.get('admin')
             if admin_role:
                 admin_user.roles.append(admin_role)
                 db.session.commit()
@@ -97,50 +218,59 @@ def init_database(app):
         else:
             print("✅ Admin user with admin role already exists")
 
-        # Ensure active users have brother role by default
-        brother_role = Role.query.filter_by(name="brother").first()
+        # Ensure active users have brother role by default - the database picks out
+        # the active users without any role row, then one executemany INSERT grants it
+        brother_role = roles_by_name.get('brother')
         if brother_role:
-            active_users = User.query.filter_by(is_active=True).all()
-            for user in active_users:
-                if not user.roles:
-                    user.roles.append(brother_role)
-            db.session.commit()
+            missing = db.session.scalars(
+                db.select(User.id).where(User.is_active == True, ~User.roles.any()).order_by(User.id)
+            ).all()
+            if missing:
+                db.session.execute(
+                    user_roles.insert(),
+                    [{'user_id': user_id, 'role_id': brother_role.id} for user_id in missing]
+                )
+                db.session.commit()
         
-        # Separately, check if Ebubechi exists as a brother
-        ebubechi = User.query.filter_by(phone="4808198055").first()
-        if not ebubechi:
+        # Separately, check if Ebubechi exists as a brother - the lookup spares hashing
+        # a password on every run, the conflict-ignoring insert covers a concurrent start
+        if not db.session.query(db.exists().where(User.phone == "4808198055")).scalar():
             print("Creating Ebubechi as a brother account...")
-            ebubechi = User(
+            # Ebubechi can have fraternity roles assigned later via admin panel
+            ebubechi_id = _seed_user(
+                "brother2024",
                 phone="4808198055",
                 first_name="Ebubechi",
                 last_name="Onyia",
                 email="ebubechi@example.com",
                 status="active"
             )
-            ebubechi.set_password("brother2024")
-            
-            # Ebubechi can have fraternity roles assigned later via admin panel
-            db.session.add(ebubechi)
             db.session.commit()
-            print("✅ Created Ebubechi as brother account")
-            print("📱 Phone: 4808198055")
-            print("🔒 Password: brother2024")
-            print("💡 Roles can be assigned via admin panel")
+            if ebubechi_id is not None:
+                print("✅ Created Ebubechi as brother account")
+                print("📱 Phone: 4808198055")
+                print("🔒 Password: brother2024")
+                print("💡 Roles can be assigned via admin panel")
+        
+        # Mark seeding complete so later starts skip it
+        db.session.merge(SystemMeta(key='bootstrapped', value='1'))
+        db.session.commit()
         
         print("Database initialized successfully!")
 
 def check_database_status():
     """Check current database status"""
-    app = create_app()
+    app = _get_app()
     
     with app.app_context():
         try:
-            # Check if tables exist
-            users_count = User.query.count()
-            roles_count = Role.query.count()
-            members_count = Member.query.count()
-            transactions_count = Transaction.query.count()
-            semesters_count = Semester.query.count()
+            # Check if tables exist - every count in one round trip
+            users_count, roles_count, members_count, transactions_count, semesters_count = db.session.execute(
+                db.select(*(
+                    db.select(db.func.count()).select_from(model).scalar_subquery()
+                    for model in (User, Role, Member, Transaction, Semester)
+                ))
+            ).one()
             
             print("📊 Database Status:")
             print(f"   Users: {users_count}")
@@ -167,7 +297,7 @@ def check_database_status():
 
 def create_treasurer_user(phone, first_name, last_name, password, email=None):
     """Create a new treasurer user"""
-    app = create_app()
+    app = _get_app()
     
     with app.app_context():
         try:
@@ -210,7 +340,7 @@ if __name__ == '__main__':
         command = sys.argv[1]
         
         if command == 'init':
-            app = create_app()
+            app = _get_app()
             init_database(app)
         
         elif command == 'status':
@@ -226,9 +356,9 @@ if __name__ == '__main__':
         
         elif command == 'force-init':
             # Force initialize database with production config
-            app = create_app('production')
+            app = _get_app('production')
             print("🚀 Force initializing database for production...")
-            init_database(app)
+            init_database(app, force=True)
         
         else:
             print("Available commands: init, status, create-treasurer, force-init")
@@ -115,7 +115,7 @@ def category_detail(category):
 @permission_required('view_chair_spending_plans')
 def view_spending_plan(plan_id):
     """View a specific spending plan"""
-    spending_plan = SpendingPlan.query.get_or_404(plan_id)
+    spending_plan = db.get_or_404(SpendingPlan, plan_id)
     plan_data = spending_plan.get_plan_data()
     
     # Get related events
@@ -192,7 +192,7 @@ def budget_summary():
 @permission_required('approve_requests')
 def approve_spending_plan(plan_id):
     """Approve a spending plan (President/VP/Treasurer only)"""
-    spending_plan = SpendingPlan.query.get_or_404(plan_id)
+    spending_plan = db.get_or_404(SpendingPlan, plan_id)
     
     approval_type = request.json.get('approval_type')  # 'president', 'vp', or 'treasurer'
     
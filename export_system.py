@@ -239,7 +239,7 @@ class DataExporter:
         plans = query.all()
         data = []
         for plan in plans:
-            creator = User.query.get(plan.created_by)
+            creator = db.session.get(User, plan.created_by)
             plan_data = plan.get_plan_data() if hasattr(plan, 'get_plan_data') else {}
             data.append({
                 'ID': plan.id,
@@ -323,7 +323,7 @@ class DataExporter:
         
         data = []
         for reimb in reimbursements:
-            user = User.query.get(reimb.requested_by)
+            user = db.session.get(User, reimb.requested_by)
             data.append({
                 'ID': reimb.id,
                 'Date Submitted': reimb.created_at.strftime('%Y-%m-%d'),
@@ -332,7 +332,7 @@ class DataExporter:
                 'Purpose': reimb.purpose,
                 'Amount': reimb.amount,
                 'Status': reimb.status.title(),
-                'Approved By': User.query.get(reimb.reviewed_by).name if reimb.reviewed_by else 'Pending',
+                'Approved By': db.session.get(User, reimb.reviewed_by).name if reimb.reviewed_by else 'Pending',
                 'Date Reviewed': reimb.reviewed_at.strftime('%Y-%m-%d') if reimb.reviewed_at else 'Pending'
             })
         
@@ -21,6 +21,17 @@ user_roles = db.Table(
     db.UniqueConstraint('user_id', 'role_id', 'revoked_at', name='uq_user_roles_active')
 )
 
+# Role hierarchy (highest to lowest)
+ROLE_HIERARCHY = {
+    'president': 7,
+    'vice_president': 6,
+    'treasurer': 5,
+    'chair_brotherhood': 4,
+    'chair_social': 4,
+    'chair_recruitment': 4,
+    'brother': 1
+}
+
 class User(UserMixin, db.Model):
     """User accounts for authentication and role management"""
     __tablename__ = 'users'
@@ -96,18 +107,7 @@ class User(UserMixin, db.Model):
         if not active_roles:
             return None
         
-        # Role hierarchy (highest to lowest)
-        role_hierarchy = {
-            'president': 7,
-            'vice_president': 6,
-            'treasurer': 5,
-            'chair_brotherhood': 4,
-            'chair_social': 4,
-            'chair_recruitment': 4,
-            'brother': 1
-        }
-        
-        return max(active_roles, key=lambda r: role_hierarchy.get(r.name, 0))
+        return max(active_roles, key=lambda r: ROLE_HIERARCHY.get(r.name, 0))
     
     @property
     def full_name(self):
@@ -178,6 +178,9 @@ class Member(db.Model):
     semester_id = db.Column(db.String(50), db.ForeignKey('semesters.id'), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
+    # Covers the per-semester member and dues lookups
+    __table_args__ = (db.Index('ix_members_semester_id', 'semester_id'),)
+    
     # Relationships
     payments = db.relationship('Payment', backref='member', lazy=True)
     payment_plan_suggestions = db.relationship('PaymentPlanSuggestion', backref='member', lazy=True)
@@ -225,6 +228,10 @@ class Payment(db.Model):
     notes = db.Column(db.Text, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
+    # Covers the per-member payment totals, the members join in the dues summary
+    # and per-member payment history in date order
+    __table_args__ = (db.Index('ix_payments_member_id_date', 'member_id', 'date'),)
+    
     def __repr__(self):
         return f'<Payment ${self.amount} by {self.member.name}>'
 
@@ -385,9 +392,23 @@ class Transaction(db.Model):
     related_request_id = db.Column(db.Integer, db.ForeignKey('reimbursement_requests.id'), nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
+    # Cover the per-semester expense totals grouped by category, the
+    # all-semester income/expense totals on the budget and transactions pages,
+    # and each chair's recent expenses in date order
+    __table_args__ = (
+        db.Index('ix_transactions_semester_type_category', 'semester_id', 'type', 'category'),
+        db.Index('ix_transactions_type_category_date', 'type', 'category', 'date'),
+    )
+    
     def __repr__(self):
         return f'<Transaction {self.type} ${self.amount} - {self.description}>'
 
+# Indexes superseded by a newer declaration, by table; database.sync_indexes() drops them where they still exist
+RETIRED_INDEXES = {
+    'payments': ('ix_payments_member_id',),  # now ix_payments_member_id_date
+    'transactions': ('ix_transactions_type_category',),  # now ix_transactions_type_category_date
+}
+
 class BudgetLimit(db.Model):
     """Budget limits by category and semester"""
     __tablename__ = 'budget_limits'
@@ -492,6 +513,9 @@ class Event(db.Model):
     is_archived = db.Column(db.Boolean, default=False)
     is_deleted = db.Column(db.Boolean, default=False)
     
+    # Covers a semester's events in date order on the dashboards
+    __table_args__ = (db.Index('ix_events_semester_id_date', 'semester_id', 'date'),)
+    
     # Relationships
     creator = db.relationship('User', foreign_keys=[created_by], backref='created_events')
     
@@ -550,6 +574,17 @@ class TreasurerConfig(db.Model):
     def __repr__(self):
         return f'<TreasurerConfig {self.name}>'
 
+class SystemMeta(db.Model):
+    """Key/value markers about the database itself, such as whether it has been bootstrapped"""
+    __tablename__ = 'system_meta'
+    
+    key = db.Column(db.String(50), primary_key=True)
+    value = db.Column(db.String(200), nullable=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<SystemMeta {self.key}={self.value}>'
+
 # Default roles and permissions
 DEFAULT_ROLES = {
     'admin': {
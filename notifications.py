@@ -383,7 +383,7 @@ class NotificationEvents:
         """Send notification when reimbursement is approved"""
         try:
             # Get the user who submitted the reimbursement
-            user = User.query.get(reimbursement.requested_by)
+            user = db.session.get(User, reimbursement.requested_by)
             if not user:
                 return
             
@@ -405,7 +405,7 @@ class NotificationEvents:
         """Send notification when spending plan is approved"""
         try:
             # Get the user who created the spending plan
-            user = User.query.get(spending_plan.created_by)
+            user = db.session.get(User, spending_plan.created_by)
             if not user:
                 return
             
@@ -194,7 +194,7 @@ def create_suggestion():
 def view_suggestion(id):
     """View a specific payment plan suggestion"""
     
-    suggestion = PaymentPlanSuggestion.query.get_or_404(id)
+    suggestion = db.get_or_404(PaymentPlanSuggestion, id)
     
     # Check if user can view this suggestion
     if not has_permission('view_all_data'):
@@ -219,7 +219,7 @@ def view_suggestion(id):
 def approve_suggestion(id):
     """Approve a payment plan suggestion"""
     
-    suggestion = PaymentPlanSuggestion.query.get_or_404(id)
+    suggestion = db.get_or_404(PaymentPlanSuggestion, id)
     
     if suggestion.status != 'pending' and suggestion.status != 'modified':
         return jsonify({'success': False, 'message': 'Suggestion is not pending approval'}), 400
@@ -266,7 +266,7 @@ def approve_suggestion(id):
 def modify_suggestion(id):
     """Modify a payment plan suggestion (treasurer counter-proposal)"""
     
-    suggestion = PaymentPlanSuggestion.query.get_or_404(id)
+    suggestion = db.get_or_404(PaymentPlanSuggestion, id)
     
     if suggestion.status not in ['pending', 'modified']:
         return jsonify({'success': False, 'message': 'Suggestion cannot be modified'}), 400
@@ -339,7 +339,7 @@ def modify_suggestion(id):
 def reject_suggestion(id):
     """Reject a payment plan suggestion"""
     
-    suggestion = PaymentPlanSuggestion.query.get_or_404(id)
+    suggestion = db.get_or_404(PaymentPlanSuggestion, id)
     
     if suggestion.status != 'pending' and suggestion.status != 'modified':
         return jsonify({'success': False, 'message': 'Suggestion is not pending'}), 400
@@ -369,7 +369,7 @@ def reject_suggestion(id):
 def accept_modified_suggestion(id):
     """Accept a treasurer's modified payment plan (member action)"""
     
-    suggestion = PaymentPlanSuggestion.query.get_or_404(id)
+    suggestion = db.get_or_404(PaymentPlanSuggestion, id)
     
     # Check if user owns this suggestion
     if suggestion.member != current_user.member_record:
@@ -147,7 +147,7 @@ def create_event():
 @portal_bp.route("/events/<int:event_id>/delete", methods=["POST"])
 @login_required
 def delete_event(event_id):
-    event = Event.query.get_or_404(event_id)
+    event = db.get_or_404(Event, event_id)
     if not can_edit_event(current_user, event):
         abort(403)
     event.is_deleted = True
@@ -270,8 +270,8 @@ def create_committee_transaction(committee):
 @portal_bp.route("/committee/transactions/<int:transaction_id>/delete", methods=["POST"])
 @login_required
 def delete_committee_transaction(transaction_id):
-    transaction = CommitteeTransaction.query.get_or_404(transaction_id)
-    committee_record = Committee.query.get(transaction.committee_id)
+    transaction = db.get_or_404(CommitteeTransaction, transaction_id)
+    committee_record = db.session.get(Committee, transaction.committee_id)
     if not committee_record or not can_manage_committee(current_user, committee_record.name.lower()):
         abort(403)
     if not has_any_role(current_user, ROLE_TREASURER, ROLE_VICE_PRESIDENT, ROLE_PRESIDENT) and (
@@ -403,7 +403,7 @@ def admin():
 def add_role(user_id):
     if not has_any_role(current_user, ROLE_VICE_PRESIDENT, ROLE_PRESIDENT):
         abort(403)
-    user = User.query.get_or_404(user_id)
+    user = db.get_or_404(User, user_id)
     role_name = request.form.get("role_name")
     if not role_name:
         flash("Role name is required.", "error")
@@ -420,7 +420,7 @@ def add_role(user_id):
 def remove_role(user_id, role_name):
     if not has_any_role(current_user, ROLE_VICE_PRESIDENT, ROLE_PRESIDENT):
         abort(403)
-    user = User.query.get_or_404(user_id)
+    user = db.get_or_404(User, user_id)
     if revoke_role(user, role_name, actor_user_id=current_user.id):
         flash("Role revoked.", "success")
     else:
@@ -122,7 +122,7 @@ def can_edit_event(user, event):
     if event.created_by_user_id == user.id or event.created_by == user.id:
         return True
     if event.committee_id:
-        committee = Committee.query.get(event.committee_id)
+        committee = db.session.get(Committee, event.committee_id)
         if committee and can_manage_committee(user, committee.name.lower()):
             return True
     return False
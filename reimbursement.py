@@ -114,7 +114,7 @@ def create_reimbursement():
             return redirect(url_for('reimbursement.create_reimbursement'))
         
         # Validate budget access
-        budget = BudgetLimit.query.get_or_404(budget_id)
+        budget = db.get_or_404(BudgetLimit, budget_id)
         if has_permission('manage_own_budget'):
             # Check if user can submit for this category
             user_roles = [role.name for role in current_user.roles]
@@ -173,7 +173,7 @@ def create_reimbursement():
 def view_reimbursement(id):
     """View a specific reimbursement request"""
     
-    reimbursement = ReimbursementRequest.query.get_or_404(id)
+    reimbursement = db.get_or_404(ReimbursementRequest, id)
     
     # Check if user can view this request
     if not has_permission('view_all_data'):
@@ -189,7 +189,7 @@ def view_reimbursement(id):
 def approve_reimbursement(id):
     """Approve a reimbursement request and create transaction"""
     
-    reimbursement = ReimbursementRequest.query.get_or_404(id)
+    reimbursement = db.get_or_404(ReimbursementRequest, id)
     
     if reimbursement.status != 'pending':
         return jsonify({'success': False, 'message': 'Request is not pending'}), 400
@@ -228,7 +228,7 @@ def approve_reimbursement(id):
 def reject_reimbursement(id):
     """Reject a reimbursement request"""
     
-    reimbursement = ReimbursementRequest.query.get_or_404(id)
+    reimbursement = db.get_or_404(ReimbursementRequest, id)
     
     if reimbursement.status != 'pending':
         return jsonify({'success': False, 'message': 'Request is not pending'}), 400
@@ -259,7 +259,7 @@ def reject_reimbursement(id):
 def view_receipt(id):
     """View receipt file for a reimbursement request"""
     
-    reimbursement = ReimbursementRequest.query.get_or_404(id)
+    reimbursement = db.get_or_404(ReimbursementRequest, id)
     
     # Check if user can view this receipt
     if not has_permission('view_all_data'):
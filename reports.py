@@ -12,6 +12,7 @@ from sqlalchemy import func, extract, and_
 import csv
 import io
 import json
+from operator import itemgetter
 
 reports_bp = Blueprint('reports', __name__, url_prefix='/reports')
 
@@ -233,7 +234,7 @@ def member_analysis():
         })
     
     # Sort by balance (highest outstanding first)
-    members_data.sort(key=lambda x: x['balance'], reverse=True)
+    members_data.sort(key=itemgetter('balance'), reverse=True)
     
     return render_template('reports/member_analysis.html',
                          current_semester=current_semester,
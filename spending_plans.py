@@ -201,7 +201,7 @@ def create_spending_plan():
 def view_spending_plan(id):
     """View a specific spending plan"""
     
-    spending_plan = SpendingPlan.query.get_or_404(id)
+    spending_plan = db.get_or_404(SpendingPlan, id)
     
     # Check if user can view this plan
     if not has_permission('view_all_data'):
@@ -245,7 +245,7 @@ def view_spending_plan(id):
 def approve_spending_plan(id):
     """Approve a spending plan (treasurer only)"""
     
-    spending_plan = SpendingPlan.query.get_or_404(id)
+    spending_plan = db.get_or_404(SpendingPlan, id)
     
     if spending_plan.treasurer_approved:
         return jsonify({'success': False, 'message': 'Plan is already approved'}), 400
@@ -300,7 +300,7 @@ def approve_spending_plan(id):
 def reject_spending_plan(id):
     """Reject a spending plan with feedback"""
     
-    spending_plan = SpendingPlan.query.get_or_404(id)
+    spending_plan = db.get_or_404(SpendingPlan, id)
     
     if spending_plan.treasurer_approved:
         return jsonify({'success': False, 'message': 'Cannot reject an approved plan'}), 400